@@ -9,8 +9,18 @@ __version__ = "1.0.0"
 __author__ = "Singularity Delta Contributors"
 __license__ = "MIT"
 
-from core.engine import Engine
-from core.result import AnalysisResult
-from rules import DEFAULT_RULES
-
 __all__ = ['Engine', 'AnalysisResult', 'DEFAULT_RULES']
+
+
+def __getattr__(name):
+    # Resolved on first access so `import cli` stays cheap
+    if name == "Engine":
+        from core.engine import Engine
+        return Engine
+    if name == "AnalysisResult":
+        from core.result import AnalysisResult
+        return AnalysisResult
+    if name == "DEFAULT_RULES":
+        from rules import DEFAULT_RULES
+        return DEFAULT_RULES
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -3,33 +3,18 @@ Command-Line Interface
 User interaction layer for Singularity Delta
 """
 
-import argparse
+import functools
 import sys
+from types import SimpleNamespace
 
-from core.engine import Engine
-from rules import DEFAULT_RULES
-from services.loader import DataLoader
-from services.validator import Validator
-from output.renderer import CLIRenderer, CompactRenderer
-from output.json_exporter import JSONExporter
 from config import Config
 
+COMMANDS = ("analyze", "validate", "version")
+FORMATS = ("cli", "json", "compact")
+_DEBUG = Config.LOG_LEVEL == "DEBUG"
 
-class CLI:
-    """
-    Command-line interface for Singularity Delta.
-    Strictly argparse-based (no interactive loops).
-    """
-
-    def __init__(self):
-        self.parser = self._create_parser()
-
-    def _create_parser(self) -> argparse.ArgumentParser:
-        parser = argparse.ArgumentParser(
-            prog="singularity-delta",
-            description=f"{Config.ENGINE_NAME} – Deterministic Policy Verification Engine",
-            formatter_class=argparse.RawDescriptionHelpFormatter,
-            epilog="""
+_DESCRIPTION = f"{Config.ENGINE_NAME} – Deterministic Policy Verification Engine"
+_EPILOG = """
 Examples:
   singularity-delta analyze system.json
   singularity-delta analyze system.json --format json --output report.json
@@ -37,11 +22,28 @@ Examples:
   singularity-delta validate system.json
   singularity-delta version
             """
-        )
 
-        subparsers = parser.add_subparsers(dest="command", required=True)
 
-        # analyze
+class CLI:
+    """
+    Command-line interface for Singularity Delta.
+    Well-formed invocations are dispatched by a small hand-written scanner;
+    help requests and malformed input fall back to argparse.
+    """
+
+    def __init__(self):
+        self.parser = None
+
+    def _create_parser(self) -> "argparse.ArgumentParser":
+        """
+        Build the argument parser with every subcommand, so help and
+        usage errors list them all. It is built once and shared by
+        CLI instances.
+        """
+        return _build_parser()
+
+    @staticmethod
+    def _build_analyze_parser(subparsers) -> None:
         analyze = subparsers.add_parser("analyze", help="Analyze system JSON")
         analyze.add_argument("file", help="Path to JSON system file")
         analyze.add_argument("--format", choices=["cli", "json", "compact"], default="cli")
@@ -49,17 +51,73 @@ Examples:
         analyze.add_argument("--no-color", action="store_true")
         analyze.add_argument("--strict", action="store_true")
 
-        # validate
+    @staticmethod
+    def _build_validate_parser(subparsers) -> None:
         validate = subparsers.add_parser("validate", help="Validate JSON structure only")
         validate.add_argument("file", help="Path to JSON system file")
 
-        # version
+    @staticmethod
+    def _build_version_parser(subparsers) -> None:
         subparsers.add_parser("version", help="Show engine version")
 
-        return parser
+    @staticmethod
+    def _fast_parse(argv):
+        """
+        Parse the common invocations without argparse.
+
+        Returns None whenever argv is anything but a plain, valid command
+        line (help flags, unknown options, bad values) so that argparse
+        can produce the usual help or error output.
+        """
+        if not argv or argv[0] not in COMMANDS:
+            return None
+
+        command, rest = argv[0], argv[1:]
+
+        if command == "version":
+            return SimpleNamespace(command=command) if not rest else None
+
+        positionals = []
+        options = {"format": "cli", "output": None, "no_color": False, "strict": False}
+        i = 0
+        while i < len(rest):
+            token = rest[i]
+            i += 1
+
+            if not token.startswith("-") or token == "-":
+                positionals.append(token)
+                continue
+            if command != "analyze":
+                return None
+
+            name, eq, value = token.partition("=")
+            if name in ("--no-color", "--strict") and not eq:
+                options[name[2:].replace("-", "_")] = True
+            elif name in ("--format", "--output"):
+                if not eq:
+                    if i >= len(rest):
+                        return None
+                    value = rest[i]
+                    i += 1
+                options[name[2:]] = value
+            else:
+                return None
+
+        if len(positionals) != 1 or options["format"] not in FORMATS:
+            return None
+
+        if command == "validate":
+            return SimpleNamespace(command=command, file=positionals[0])
+        return SimpleNamespace(command=command, file=positionals[0], **options)
 
     def run(self, argv=None):
-        args = self.parser.parse_args(argv)
+        if argv is None:
+            argv = sys.argv[1:]
+
+        args = self._fast_parse(argv)
+        if args is None:
+            self.parser = self._create_parser()
+            args = self.parser.parse_args(argv)
 
         if args.command == "analyze":
             return self._analyze(args)
@@ -75,6 +133,13 @@ Examples:
     # -------------------- COMMAND HANDLERS --------------------
 
     def _analyze(self, args) -> int:
+        from core.engine import Engine
+        from rules import DEFAULT_RULES
+        from services.loader import DataLoader
+        from services.validator import Validator
+        from output.renderer import CLIRenderer, CompactRenderer
+        from output.json_exporter import JSONExporter
+
         try:
             data = DataLoader.load_from_file(args.file)
             target = DataLoader.get_target_name(data)
@@ -91,7 +156,9 @@ Examples:
             result = engine.run(data, target)
 
             if args.format == "cli":
-                CLIRenderer.render(result, use_colors=not args.no_color)
+                # Escape codes only make sense on a terminal
+                use_colors = not args.no_color and sys.stdout.isatty()
+                CLIRenderer.render(result, use_colors=use_colors)
 
             elif args.format == "compact":
                 CompactRenderer.render(result)
@@ -111,12 +178,15 @@ Examples:
 
         except Exception as e:
             print(f"❌ Error: {e}")
-            if Config.LOG_LEVEL == "DEBUG":
+            if _DEBUG:
                 import traceback
                 traceback.print_exc()
             return 1
 
     def _validate(self, args) -> int:
+        from services.loader import DataLoader
+        from services.validator import Validator
+
         try:
             data = DataLoader.load_from_file(args.file)
             valid, msg = Validator.quick_validate(data)
@@ -139,20 +209,39 @@ Examples:
             return 1
 
     def _version(self) -> int:
+        from rules import RULE_COUNT, CATEGORY_COUNTS
+
         print(f"{Config.ENGINE_NAME} v{Config.ENGINE_VERSION}")
         print("Deterministic Policy Verification Engine\n")
-        print(f"Rules Loaded: {len(DEFAULT_RULES)}")
-
-        categories = {}
-        for rule in DEFAULT_RULES:
-            categories[rule.category] = categories.get(rule.category, 0) + 1
+        print(f"Rules Loaded: {RULE_COUNT}")
 
-        for cat, count in sorted(categories.items()):
+        for cat, count in sorted(CATEGORY_COUNTS.items()):
             print(f"  {cat}: {count}")
 
         return 0
 
 
+@functools.lru_cache(maxsize=None)
+def _build_parser() -> "argparse.ArgumentParser":
+    """Construct the argparse parser for all commands"""
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        prog="singularity-delta",
+        description=_DESCRIPTION,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=_EPILOG
+    )
+
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    CLI._build_analyze_parser(subparsers)
+    CLI._build_validate_parser(subparsers)
+    CLI._build_version_parser(subparsers)
+
+    return parser
+
+
 def main():
     cli = CLI()
     exit_code = cli.run()
@@ -2,6 +2,7 @@
 Configuration Management
 Centralized configuration for the entire system
 """
+from types import MappingProxyType
 from typing import Dict, Any
 
 
@@ -20,14 +21,14 @@ class Config:
     MIN_SCORE = 0.0
     MAX_SCORE = 100.0
     
-    # Severity Weights
-    SEVERITY_WEIGHTS = {
+    # Severity Weights (read-only)
+    SEVERITY_WEIGHTS = MappingProxyType({
         "CRITICAL": 40,
         "HIGH": 20,
         "MEDIUM": 10,
         "LOW": 5,
         "INFO": 1
-    }
+    })
     
     # Output Configuration
     DEFAULT_OUTPUT_FORMAT = "cli"  # cli | json | compact
@@ -53,32 +54,44 @@ class Config:
     
     @classmethod
     def to_dict(cls) -> Dict[str, Any]:
-        """Export configuration as dictionary"""
-        return {
-            "engine": {
-                "version": cls.ENGINE_VERSION,
-                "name": cls.ENGINE_NAME
-            },
-            "scoring": {
-                "base_score": cls.BASE_SCORE,
-                "severity_weights": cls.SEVERITY_WEIGHTS
-            },
-            "output": {
-                "format": cls.DEFAULT_OUTPUT_FORMAT,
-                "use_colors": cls.USE_COLORS,
-                "pretty_json": cls.PRETTY_JSON
-            },
-            "validation": {
-                "max_nesting_depth": cls.MAX_NESTING_DEPTH,
-                "max_system_name_length": cls.MAX_SYSTEM_NAME_LENGTH
-            },
-            "rules": {
-                "enable_all": cls.ENABLE_ALL_RULES,
-                "strict_mode": cls.STRICT_MODE
-            }
-        }
+        """Export configuration as dictionary (built once at import; do not mutate)"""
+        return _CONFIG_DICT
     
     @classmethod
     def get(cls, key: str, default: Any = None) -> Any:
         """Get configuration value by key"""
-        return getattr(cls, key.upper(), default)
+        return _CONFIG_VALUES.get(key.upper(), default)
+
+
+def _build_config_dict(cls) -> Dict[str, Any]:
+    """Build the nested export view of a configuration class"""
+    return {
+        "engine": {
+            "version": cls.ENGINE_VERSION,
+            "name": cls.ENGINE_NAME
+        },
+        "scoring": {
+            "base_score": cls.BASE_SCORE,
+            "severity_weights": dict(cls.SEVERITY_WEIGHTS)
+        },
+        "output": {
+            "format": cls.DEFAULT_OUTPUT_FORMAT,
+            "use_colors": cls.USE_COLORS,
+            "pretty_json": cls.PRETTY_JSON
+        },
+        "validation": {
+            "max_nesting_depth": cls.MAX_NESTING_DEPTH,
+            "max_system_name_length": cls.MAX_SYSTEM_NAME_LENGTH
+        },
+        "rules": {
+            "enable_all": cls.ENABLE_ALL_RULES,
+            "strict_mode": cls.STRICT_MODE
+        }
+    }
+
+
+# Settings are constant for the life of the process, so both views are built once
+_CONFIG_VALUES = MappingProxyType({
+    name: value for name, value in vars(Config).items() if name.isupper()
+})
+_CONFIG_DICT = _build_config_dict(Config)
@@ -1,8 +1,19 @@
 """
 Core Engine Components
 """
-from .engine import Engine
-from .result import AnalysisResult
-from .context import ExecutionContext
 
 __all__ = ['Engine', 'AnalysisResult', 'ExecutionContext']
+
+
+def __getattr__(name):
+    # Resolved on first access so importing a submodule does not load the engine
+    if name == "Engine":
+        from .engine import Engine
+        return Engine
+    if name == "AnalysisResult":
+        from .result import AnalysisResult
+        return AnalysisResult
+    if name == "ExecutionContext":
+        from .context import ExecutionContext
+        return ExecutionContext
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -6,8 +6,28 @@ These are NOT configurable - they are mathematical truths.
 """
 
 from enum import Enum
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Iterable, Tuple
 from dataclasses import dataclass
+import json
+
+
+# Preformatted whole-percent strings ("0.00%" .. "100.00%")
+_PCT_LOOKUP = tuple(f"{i / 100:.2%}" for i in range(101))
+
+
+def _format_pct(value: float) -> str:
+    """Format value like f"{value:.2%}", using the lookup table for whole percents"""
+    index = round(value * 100)
+    if 0 <= index <= 100 and index / 100 == value:
+        return _PCT_LOOKUP[index]
+    return f"{value:.2%}"
+
+
+def _context_key(context: Dict[str, Any], keys: Optional[Tuple[str, ...]]) -> str:
+    """Serialize the part of context an axiom reads (all of it if keys is None)"""
+    if keys is not None:
+        context = {key: context[key] for key in keys if key in context}
+    return json.dumps(context, sort_keys=True, default=str)
 
 
 class AxiomViolationType(Enum):
@@ -21,16 +41,29 @@ class AxiomViolationType(Enum):
     COUNTERFACTUAL_FAILURE = "counterfactual_failure"
 
 
-@dataclass
+@dataclass(frozen=True)
 class AxiomViolation:
     """Represents a violation of a foundational axiom"""
+    __slots__ = ("axiom_name", "violation_type", "severity",
+                 "evidence", "causal_chain", "explanation")
+    
     axiom_name: str
     violation_type: AxiomViolationType
     severity: float  # 0.0 - 1.0, where 1.0 = system cannot exist
     evidence: Dict[str, Any]
-    causal_chain: list[str]
+    causal_chain: tuple[str, ...]
     explanation: str
     
+    def __post_init__(self):
+        # Violations are immutable records; store the chain as a tuple
+        object.__setattr__(self, "causal_chain", tuple(self.causal_chain))
+    
+    def __reduce__(self):
+        # Frozen + __slots__ cannot be restored by the default pickle path,
+        # which assigns attributes; rebuild through the constructor instead
+        return (type(self), (self.axiom_name, self.violation_type, self.severity,
+                             self.evidence, self.causal_chain, self.explanation))
+    
     def is_fatal(self) -> bool:
         """Fatal violations prevent system existence"""
         return self.severity >= 0.95
@@ -39,6 +72,15 @@ class AxiomViolation:
 class AxiomBase:
     """Base class for all axioms in SINGULARITY-Δ"""
     
+    # Formal statement of the axiom, returned by explain()
+    EXPLANATION: str = ""
+    
+    # Inputs verify() depends on, used to key cached results:
+    # whether it walks the graph, and which context keys it reads
+    # (None means the whole context)
+    READS_GRAPH: bool = True
+    CONTEXT_KEYS: Optional[Tuple[str, ...]] = None
+    
     def __init__(self):
         self.name: str = "BASE_AXIOM"
         self.description: str = ""
@@ -53,7 +95,9 @@ class AxiomBase:
     
     def explain(self) -> str:
         """Explain this axiom in formal terms"""
-        raise NotImplementedError("Axiom must implement explain()")
+        if not self.EXPLANATION:
+            raise NotImplementedError("Axiom must define EXPLANATION")
+        return self.EXPLANATION
 
 
 class ExistenceAxiom(AxiomBase):
@@ -64,6 +108,17 @@ class ExistenceAxiom(AxiomBase):
     All system behavior derives from these decisions.
     """
     
+    EXPLANATION = """
+        EXISTENCE AXIOM:
+        ∀ behavior B, ∃ decision D such that B derives from D
+        
+        If any observable system behavior cannot be traced to an explicit
+        engineering decision, the system model is incomplete and cannot
+        be verified.
+        """
+    
+    CONTEXT_KEYS = ()
+    
     def __init__(self):
         super().__init__()
         self.name = "EXISTENCE_AXIOM"
@@ -88,16 +143,6 @@ class ExistenceAxiom(AxiomBase):
             )
         
         return None
-    
-    def explain(self) -> str:
-        return """
-        EXISTENCE AXIOM:
-        ∀ behavior B, ∃ decision D such that B derives from D
-        
-        If any observable system behavior cannot be traced to an explicit
-        engineering decision, the system model is incomplete and cannot
-        be verified.
-        """
 
 
 class ContradictionLaw(AxiomBase):
@@ -108,6 +153,16 @@ class ContradictionLaw(AxiomBase):
     There is no "partial validity" - contradictions are fatal.
     """
     
+    EXPLANATION = """
+        CONTRADICTION LAW:
+        ∀ decisions D1, D2: if ¬(D1 ∧ D2), then System is INVALID
+        
+        If any two decisions in the system cannot both be true simultaneously,
+        the system cannot logically exist. Time does not resolve contradictions.
+        """
+    
+    CONTEXT_KEYS = ()
+    
     def __init__(self):
         super().__init__()
         self.name = "CONTRADICTION_LAW"
@@ -118,32 +173,28 @@ class ContradictionLaw(AxiomBase):
         contradictions = reality_graph.find_contradictions()
         
         if contradictions:
-            # Find the most severe contradiction
-            max_severity = max(c.severity for c in contradictions)
-            primary_contradiction = next(c for c in contradictions if c.severity == max_severity)
+            # Find the most severe contradiction (first one wins on ties)
+            primary_index = max(range(len(contradictions)),
+                                key=lambda i: contradictions[i].severity)
+            primary_contradiction = contradictions[primary_index]
+            max_severity = primary_contradiction.severity
+            
+            # Serialize each contradiction once; "primary" reuses its entry
+            serialized = [c.to_dict() for c in contradictions]
             
             return AxiomViolation(
                 axiom_name=self.name,
                 violation_type=AxiomViolationType.CONTRADICTION,
                 severity=max_severity,
                 evidence={
-                    "contradictions": [c.to_dict() for c in contradictions],
-                    "primary": primary_contradiction.to_dict()
+                    "contradictions": serialized,
+                    "primary": serialized[primary_index]
                 },
                 causal_chain=primary_contradiction.causal_chain,
                 explanation=primary_contradiction.explanation
             )
         
         return None
-    
-    def explain(self) -> str:
-        return """
-        CONTRADICTION LAW:
-        ∀ decisions D1, D2: if ¬(D1 ∧ D2), then System is INVALID
-        
-        If any two decisions in the system cannot both be true simultaneously,
-        the system cannot logically exist. Time does not resolve contradictions.
-        """
 
 
 class InevitabilityAxiom(AxiomBase):
@@ -154,6 +205,18 @@ class InevitabilityAxiom(AxiomBase):
     the system is considered already failed regardless of time.
     """
     
+    EXPLANATION = """
+        INEVITABILITY AXIOM:
+        if P(failure) = 1.0 across all execution paths,
+        then System is FAILED at t=0
+        
+        Time is not a factor in logical existence. If collapse is certain,
+        the system has already collapsed from a logical perspective.
+        """
+    
+    READS_GRAPH = False
+    CONTEXT_KEYS = ("failure_inevitability_index", "failure_paths")
+    
     def __init__(self):
         super().__init__()
         self.name = "INEVITABILITY_AXIOM"
@@ -176,20 +239,10 @@ class InevitabilityAxiom(AxiomBase):
                     "escape_paths": 0
                 },
                 causal_chain=["all_paths_analyzed", "no_escape_route", "collapse_certain"],
-                explanation=f"Failure Inevitability Index: {fii:.2%}. No viable execution path exists."
+                explanation=f"Failure Inevitability Index: {_format_pct(fii)}. No viable execution path exists."
             )
         
         return None
-    
-    def explain(self) -> str:
-        return """
-        INEVITABILITY AXIOM:
-        if P(failure) = 1.0 across all execution paths,
-        then System is FAILED at t=0
-        
-        Time is not a factor in logical existence. If collapse is certain,
-        the system has already collapsed from a logical perspective.
-        """
 
 
 class CounterfactualValidityAxiom(AxiomBase):
@@ -200,6 +253,18 @@ class CounterfactualValidityAxiom(AxiomBase):
     Fragility to minor changes indicates structural invalidity.
     """
     
+    EXPLANATION = """
+        COUNTERFACTUAL VALIDITY:
+        System S is valid ⟹ S remains coherent in alternate reality R
+        where R represents reasonable perturbations to assumptions
+        
+        A system that collapses when assumptions are slightly violated
+        is fundamentally invalid, not just fragile.
+        """
+    
+    READS_GRAPH = False
+    CONTEXT_KEYS = ("counterfactual_results",)
+    
     def __init__(self):
         super().__init__()
         self.name = "COUNTERFACTUAL_VALIDITY"
@@ -209,37 +274,32 @@ class CounterfactualValidityAxiom(AxiomBase):
         """Test system against counterfactual scenarios"""
         counterfactual_results = context.get("counterfactual_results", [])
         
-        failed_scenarios = [r for r in counterfactual_results if not r["survived"]]
-        critical_failures = [r for r in failed_scenarios if r["scenario_criticality"] >= 0.7]
+        failed_scenarios = []
+        critical_failures = []
+        for r in counterfactual_results:
+            if not r["survived"]:
+                failed_scenarios.append(r)
+                if r["scenario_criticality"] >= 0.7:
+                    critical_failures.append(r)
         
-        if critical_failures:
-            failure_rate = len(failed_scenarios) / len(counterfactual_results) if counterfactual_results else 0
-            
-            return AxiomViolation(
-                axiom_name=self.name,
-                violation_type=AxiomViolationType.COUNTERFACTUAL_FAILURE,
-                severity=min(0.9, failure_rate),
-                evidence={
-                    "failed_scenarios": len(failed_scenarios),
-                    "critical_failures": len(critical_failures),
-                    "total_tested": len(counterfactual_results),
-                    "details": critical_failures[:3]  # Top 3
-                },
-                causal_chain=["counterfactual_test", "critical_scenario_failure"],
-                explanation=f"System collapsed in {len(critical_failures)} critical alternate scenarios"
-            )
+        if not critical_failures:
+            return None
         
-        return None
-    
-    def explain(self) -> str:
-        return """
-        COUNTERFACTUAL VALIDITY:
-        System S is valid ⟹ S remains coherent in alternate reality R
-        where R represents reasonable perturbations to assumptions
+        failure_rate = len(failed_scenarios) / len(counterfactual_results) if counterfactual_results else 0
         
-        A system that collapses when assumptions are slightly violated
-        is fundamentally invalid, not just fragile.
-        """
+        return AxiomViolation(
+            axiom_name=self.name,
+            violation_type=AxiomViolationType.COUNTERFACTUAL_FAILURE,
+            severity=min(0.9, failure_rate),
+            evidence={
+                "failed_scenarios": len(failed_scenarios),
+                "critical_failures": len(critical_failures),
+                "total_tested": len(counterfactual_results),
+                "details": critical_failures[:3]  # Top 3
+            },
+            causal_chain=["counterfactual_test", "critical_scenario_failure"],
+            explanation=f"System collapsed in {len(critical_failures)} critical alternate scenarios"
+        )
 
 
 class HumanDependencyParadox(AxiomBase):
@@ -250,6 +310,18 @@ class HumanDependencyParadox(AxiomBase):
     has a single point of failure and cannot be considered valid.
     """
     
+    EXPLANATION = """
+        HUMAN DEPENDENCY PARADOX:
+        if ∃ human H such that (H unavailable ⟹ System fails),
+        then System is INVALID
+        
+        Humans are inherently unreliable (leave, sleep, err, die).
+        A system that requires a specific human is logically unstable.
+        """
+    
+    READS_GRAPH = False
+    CONTEXT_KEYS = ("human_dependencies",)
+    
     def __init__(self):
         super().__init__()
         self.name = "HUMAN_DEPENDENCY_PARADOX"
@@ -259,35 +331,25 @@ class HumanDependencyParadox(AxiomBase):
         """Detect critical human dependencies"""
         human_dependencies = context.get("human_dependencies", [])
         
+        if not any(h.get("is_single_point_of_failure", False) for h in human_dependencies):
+            return None
+        
         critical_dependencies = [
             h for h in human_dependencies 
             if h.get("is_single_point_of_failure", False)
         ]
         
-        if critical_dependencies:
-            return AxiomViolation(
-                axiom_name=self.name,
-                violation_type=AxiomViolationType.HUMAN_DEPENDENCY,
-                severity=0.85,
-                evidence={
-                    "critical_humans": [h["identifier"] for h in critical_dependencies],
-                    "failure_scenarios": [h["failure_scenario"] for h in critical_dependencies]
-                },
-                causal_chain=["human_identified", "no_redundancy", "single_point_of_failure"],
-                explanation=f"System stability depends on {len(critical_dependencies)} irreplaceable human(s)"
-            )
-        
-        return None
-    
-    def explain(self) -> str:
-        return """
-        HUMAN DEPENDENCY PARADOX:
-        if ∃ human H such that (H unavailable ⟹ System fails),
-        then System is INVALID
-        
-        Humans are inherently unreliable (leave, sleep, err, die).
-        A system that requires a specific human is logically unstable.
-        """
+        return AxiomViolation(
+            axiom_name=self.name,
+            violation_type=AxiomViolationType.HUMAN_DEPENDENCY,
+            severity=0.85,
+            evidence={
+                "critical_humans": [h["identifier"] for h in critical_dependencies],
+                "failure_scenarios": [h["failure_scenario"] for h in critical_dependencies]
+            },
+            causal_chain=["human_identified", "no_redundancy", "single_point_of_failure"],
+            explanation=f"System stability depends on {len(critical_dependencies)} irreplaceable human(s)"
+        )
 
 
 class SilentAssumptionLaw(AxiomBase):
@@ -298,6 +360,18 @@ class SilentAssumptionLaw(AxiomBase):
     and must be stress-tested until it breaks.
     """
     
+    EXPLANATION = """
+        SILENT ASSUMPTION LAW:
+        ∀ assumption A: if A is unstated, treat A as hostile
+        
+        Assumptions are where systems fail. Every implicit assumption
+        must be made explicit and stress-tested until it breaks.
+        If it breaks, the system is invalid.
+        """
+    
+    READS_GRAPH = False
+    CONTEXT_KEYS = ("extracted_assumptions", "hostile_assumptions")
+    
     def __init__(self):
         super().__init__()
         self.name = "SILENT_ASSUMPTION_LAW"
@@ -308,62 +382,108 @@ class SilentAssumptionLaw(AxiomBase):
         assumptions = context.get("extracted_assumptions", [])
         hostile_assumptions = context.get("hostile_assumptions", [])
         
+        if not any(a.get("stress_test_failed", False) for a in hostile_assumptions):
+            return None
+        
         violated_assumptions = [
             a for a in hostile_assumptions
             if a.get("stress_test_failed", False)
         ]
         
-        if violated_assumptions:
-            return AxiomViolation(
-                axiom_name=self.name,
-                violation_type=AxiomViolationType.SILENT_ASSUMPTION,
-                severity=0.75,
-                evidence={
-                    "total_assumptions": len(assumptions),
-                    "violated": len(violated_assumptions),
-                    "details": violated_assumptions[:5]
-                },
-                causal_chain=["assumption_extracted", "stress_test", "assumption_violated"],
-                explanation=f"{len(violated_assumptions)} critical assumptions failed stress testing"
-            )
-        
-        return None
-    
-    def explain(self) -> str:
-        return """
-        SILENT ASSUMPTION LAW:
-        ∀ assumption A: if A is unstated, treat A as hostile
-        
-        Assumptions are where systems fail. Every implicit assumption
-        must be made explicit and stress-tested until it breaks.
-        If it breaks, the system is invalid.
-        """
+        return AxiomViolation(
+            axiom_name=self.name,
+            violation_type=AxiomViolationType.SILENT_ASSUMPTION,
+            severity=0.75,
+            evidence={
+                "total_assumptions": len(assumptions),
+                "violated": len(violated_assumptions),
+                "details": violated_assumptions[:5]
+            },
+            causal_chain=["assumption_extracted", "stress_test", "assumption_violated"],
+            explanation=f"{len(violated_assumptions)} critical assumptions failed stress testing"
+        )
+
+
+# Axioms are stateless, so a single instance of each is shared by every registry
+_AXIOMS: tuple[AxiomBase, ...] = (
+    ExistenceAxiom(),
+    ContradictionLaw(),
+    InevitabilityAxiom(),
+    CounterfactualValidityAxiom(),
+    HumanDependencyParadox(),
+    SilentAssumptionLaw(),
+)
+
+# Explanations are static text, so the combined document is joined once
+_EXPLAIN_ALL = "\n\n".join(axiom.EXPLANATION for axiom in _AXIOMS)
 
 
 class AxiomRegistry:
     """Registry of all axioms that govern SINGULARITY-Δ"""
     
     def __init__(self):
-        self.axioms: list[AxiomBase] = [
-            ExistenceAxiom(),
-            ContradictionLaw(),
-            InevitabilityAxiom(),
-            CounterfactualValidityAxiom(),
-            HumanDependencyParadox(),
-            SilentAssumptionLaw(),
-        ]
-    
-    def verify_all(self, reality_graph, context: Dict[str, Any]) -> list[AxiomViolation]:
+        # Keyed by axiom name; insertion order is the verification order
+        self.axioms: dict[str, AxiomBase] = {axiom.name: axiom for axiom in _AXIOMS}
+    
+    @property
+    def axiom_list(self) -> list[AxiomBase]:
+        """Axioms in verification order"""
+        return list(self.axioms.values())
+    
+    def get(self, name: str) -> Optional[AxiomBase]:
+        """Look up an axiom by name"""
+        return self.axioms.get(name)
+    
+    def verify_all(self, reality_graph, context: Dict[str, Any], *,
+                   stop_on_fatal: bool = True,
+                   cache=None,
+                   only: Optional[Iterable[str]] = None) -> list[AxiomViolation]:
         """
         Verify all axioms and return violations.
         Fatal violations prevent system existence.
+        
+        With stop_on_fatal (the default) verification ends at the first
+        fatal violation, since the system is already invalid. Pass False
+        to collect diagnostics from every axiom.
+        
+        If cache (an ExecutionContext) is given, each axiom's result is
+        memoized on its name and the inputs it declares (READS_GRAPH,
+        CONTEXT_KEYS), so re-verifying with unchanged inputs - e.g. the
+        same graph under a context that differs only in keys the axioms
+        ignore - skips the work. The graph enters the key as its version
+        token, never its contents.
+        
+        If only is given, just the named axioms are verified (still in
+        registry order); unknown names raise ValueError.
         """
         violations = []
         
-        for axiom in self.axioms:
-            violation = axiom.verify(reality_graph, context)
+        axioms = self.axioms.values()
+        if only is not None:
+            only = set(only)
+            unknown = only.difference(self.axioms)
+            if unknown:
+                raise ValueError(f"Unknown axioms: {', '.join(sorted(unknown))}")
+            axioms = [axiom for name, axiom in self.axioms.items() if name in only]
+        
+        graph_key = None
+        if cache is not None and any(axiom.READS_GRAPH for axiom in axioms):
+            graph_key = reality_graph.version
+        
+        for axiom in axioms:
+            if cache is not None:
+                violation = cache.memo(
+                    ("axiom", axiom.name,
+                     graph_key if axiom.READS_GRAPH else None,
+                     _context_key(context, axiom.CONTEXT_KEYS)),
+                    lambda axiom=axiom: axiom.verify(reality_graph, context)
+                )
+            else:
+                violation = axiom.verify(reality_graph, context)
             if violation:
                 violations.append(violation)
+                if stop_on_fatal and violation.is_fatal():
+                    break
         
         return violations
     
@@ -373,5 +493,9 @@ class AxiomRegistry:
     
     def explain_all(self) -> str:
         """Generate formal explanation of all axioms"""
-        explanations = [axiom.explain() for axiom in self.axioms]
+        if len(self.axioms) == len(_AXIOMS) and all(
+                a is b for a, b in zip(self.axioms.values(), _AXIOMS)):
+            return _EXPLAIN_ALL
+        
+        explanations = [axiom.explain() for axiom in self.axioms.values()]
         return "\n\n".join(explanations)
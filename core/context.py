@@ -2,7 +2,9 @@
 Execution Context
 Provides runtime information to rules during evaluation
 """
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Callable, Hashable
+
+_MISSING = object()
 
 
 class ExecutionContext:
@@ -14,6 +16,8 @@ class ExecutionContext:
     def __init__(self):
         self.config: Dict[str, Any] = {}
         self.cache: Dict[str, Any] = {}
+        # Values derived from the data of the current Engine.run only
+        self.run_cache: Dict[Hashable, Any] = {}
         self.metadata: Dict[str, Any] = {}
         self.strict_mode: bool = False
         self.debug: bool = False
@@ -30,6 +34,18 @@ class ExecutionContext:
         """Check if key exists in context"""
         return key in self.cache
     
+    def memo(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+        """Return the cached value for key, computing and storing it on a miss"""
+        value = self.cache.get(key, _MISSING)
+        if value is _MISSING:
+            value = compute()
+            self.cache[key] = value
+        return value
+    
+    def clear_run_cache(self) -> None:
+        """Drop values derived from the data of a previous run"""
+        self.run_cache.clear()
+    
     def enable_strict_mode(self) -> None:
         """Enable strict validation mode"""
         self.strict_mode = True
@@ -10,10 +10,247 @@ This is NOT scenario planning or what-if analysis.
 This is LOGICAL ROBUSTNESS VERIFICATION.
 """
 
-from dataclasses import dataclass
-from typing import List, Dict, Any, Callable
+from dataclasses import dataclass, fields
+from typing import List, Dict, Any, Callable, Optional, Set
 from enum import Enum
+from concurrent.futures import ProcessPoolExecutor
 import copy
+from operator import attrgetter
+
+from core.reality_graph.graph_builder import Node, Edge, NodeType, EdgeType
+
+
+# Types whose instances can be shared between a graph and its clone
+_IMMUTABLE = frozenset({int, float, bool, str, bytes, type(None), frozenset})
+
+# Positional field values of the graph record types, in __init__ order
+_FIELD_GETTERS = {
+    cls: attrgetter(*(f.name for f in fields(cls)))
+    for cls in (Node, Edge)
+}
+
+
+def _fast_clone(obj):
+    """
+    Deep-copy the values found in reality graphs.
+    Dispatches on the exact type instead of going through copy.deepcopy's
+    generic memo/reduce machinery; unknown types still fall back to it.
+    """
+    cls = type(obj)
+    if cls in _IMMUTABLE:
+        return obj
+    if cls is dict:
+        return {k: _fast_clone(v) for k, v in obj.items()}
+    if cls is list:
+        return [_fast_clone(v) for v in obj]
+    if cls is tuple:
+        return tuple(_fast_clone(v) for v in obj)
+    if cls is set:
+        return {_fast_clone(v) for v in obj}
+    if cls is Node or cls is Edge:
+        # Rebuild from all field values in one C-level attrgetter call
+        # (works whether or not the class uses __slots__)
+        clone = cls(*_FIELD_GETTERS[cls](obj))
+        clone.metadata = _fast_clone(obj.metadata)
+        return clone
+    return copy.deepcopy(obj)
+
+
+def _key_suffix(entries: Dict[str, Any], keys: Set[str]) -> List[str]:
+    """Keys of an ordered dict from the earliest of the given keys onward"""
+    suffix = []
+    pending = len(keys)
+    for key in reversed(entries):
+        if not pending:
+            break
+        suffix.append(key)
+        if key in keys:
+            pending -= 1
+    suffix.reverse()
+    return suffix
+
+
+def _reinsert(entries: Dict[str, Any], suffix: List[str], removed: Dict[str, Any]):
+    """Put removed entries back, re-appending the suffix in its old order"""
+    for key in suffix:
+        entries[key] = removed[key] if key in removed else entries.pop(key)
+
+
+class _GraphJournal:
+    """
+    Applies scenario edits to a graph in place and records how to undo them.
+    
+    Edits are limited to a small op set (set_metadata, remove_node,
+    add_edge); rollback() reverts them in reverse order, restoring node and
+    edge ordering and the graph's version, so a scenario can run on the base
+    graph without a clone.
+    """
+    
+    def __init__(self, graph):
+        self.graph = graph
+        self._undo: List[Callable[[], None]] = []
+        self._copied_metadata: Set[str] = set()
+        self._version = graph.version
+    
+    def set_metadata(self, node_id: str, key: str, value: Any):
+        """Set a node metadata entry"""
+        node = self.graph.nodes[node_id]
+        if node_id not in self._copied_metadata:
+            # Copy-on-write: the node gets its own dict on first write, and
+            # the untouched original is put back on rollback
+            original = node.metadata
+            
+            def restore():
+                node.metadata = original
+                self._copied_metadata.discard(node_id)
+            
+            self._undo.append(restore)
+            self._copied_metadata.add(node_id)
+            node.metadata = dict(original)
+        node.metadata[key] = value
+        self.graph.touch()
+    
+    def remove_node(self, node_id: str):
+        """Remove a node and all its connected edges"""
+        graph = self.graph
+        if node_id not in graph.nodes:
+            return
+        
+        # The adjacency indexes hold exactly the connected edges
+        edge_ids = (graph._adjacency.get(node_id, set())
+                    | graph._reverse_adjacency.get(node_id, set()))
+        
+        # Only the removed entries are kept, plus the keys that follow them
+        # so rollback can put the dicts back in their original order
+        node_suffix = _key_suffix(graph.nodes, {node_id})
+        edge_suffix = _key_suffix(graph.edges, edge_ids)
+        node = graph.nodes.pop(node_id)
+        edges = {edge_id: graph.edges.pop(edge_id) for edge_id in edge_ids}
+        adjacency = graph._adjacency.pop(node_id, None)
+        reverse_adjacency = graph._reverse_adjacency.pop(node_id, None)
+        
+        # Neighbours' adjacency sets are trimmed in place
+        for edge in edges.values():
+            if edge.source != node_id and edge.source in graph._adjacency:
+                graph._adjacency[edge.source].discard(edge.id)
+            if edge.target != node_id and edge.target in graph._reverse_adjacency:
+                graph._reverse_adjacency[edge.target].discard(edge.id)
+        
+        def restore():
+            _reinsert(graph.nodes, node_suffix, {node_id: node})
+            _reinsert(graph.edges, edge_suffix, edges)
+            if adjacency is not None:
+                graph._adjacency[node_id] = adjacency
+            if reverse_adjacency is not None:
+                graph._reverse_adjacency[node_id] = reverse_adjacency
+            for edge in edges.values():
+                if edge.source != node_id and edge.source in graph._adjacency:
+                    graph._adjacency[edge.source].add(edge.id)
+                if edge.target != node_id and edge.target in graph._reverse_adjacency:
+                    graph._reverse_adjacency[edge.target].add(edge.id)
+        
+        self._undo.append(restore)
+        graph.touch()
+    
+    def add_edge(self, edge: Edge):
+        """Add an edge"""
+        graph = self.graph
+        graph.add_edge(edge)
+        
+        def remove():
+            del graph.edges[edge.id]
+            graph._adjacency[edge.source].discard(edge.id)
+            graph._reverse_adjacency[edge.target].discard(edge.id)
+        
+        self._undo.append(remove)
+    
+    def rollback(self):
+        """Undo every recorded edit, newest first"""
+        while self._undo:
+            self._undo.pop()()
+        # The graph is back to the contents its old version identified
+        self.graph._version = self._version
+
+
+class _Edit:
+    """
+    A scenario modification expressed as journal operations.
+    
+    Module-level and built from plain arguments, so scenarios can be
+    pickled and shipped to worker processes. Calling it with a graph
+    applies the edit permanently, like any other modification callable.
+    """
+    
+    def __init__(self, operation: Callable, *args):
+        self.operation = operation
+        self.args = args
+    
+    def apply(self, journal: _GraphJournal):
+        """Apply the edit through a journal so it can be rolled back"""
+        self.operation(journal, *self.args)
+    
+    def __call__(self, graph):
+        self.apply(_GraphJournal(graph))
+
+
+# Edit operations
+
+def _traffic_spike(journal: _GraphJournal, multiplier: float):
+    """Scale resource demand feeding CPU/memory resources"""
+    graph = journal.graph
+    
+    # Find load-bearing resources
+    resources = graph.get_nodes_by_type(NodeType.RESOURCE)
+    
+    for resource in resources:
+        if "cpu" in resource.name.lower() or "memory" in resource.name.lower():
+            # Increase demand on this resource
+            incoming = graph.get_incoming_edges(resource.id)
+            for edge in incoming:
+                source_node = graph.get_node(edge.source)
+                if "resource_demand" in source_node.metadata:
+                    journal.set_metadata(source_node.id, "resource_demand",
+                                         source_node.metadata["resource_demand"] * multiplier)
+
+
+def _node_failure(journal: _GraphJournal, node_id: str):
+    """Remove a node and all its connected edges"""
+    journal.remove_node(node_id)
+
+
+def _remove_resource(journal: _GraphJournal, resource_id: str):
+    """Mark a resource as unavailable"""
+    # Similar to node failure
+    if resource_id in journal.graph.nodes:
+        # Mark resource as unavailable instead of removing
+        # (so we can trace dependencies)
+        journal.set_metadata(resource_id, "available", False)
+        journal.set_metadata(resource_id, "capacity", 0)
+
+
+def _violate_assumption(journal: _GraphJournal, assumption_id: str):
+    """Contradict every node that relies on an assumption"""
+    graph = journal.graph
+    if assumption_id in graph.nodes:
+        assumption = graph.get_node(assumption_id)
+        
+        # Find all nodes that depend on this assumption
+        outgoing = graph.get_outgoing_edges(assumption_id)
+        
+        for edge in outgoing:
+            if edge.type == EdgeType.ASSUMES:
+                # This node assumed something that's now false
+                # Add a contradiction edge
+                contra_edge = Edge(
+                    source=edge.target,
+                    target=assumption_id,
+                    type=EdgeType.CONTRADICTS,
+                    metadata={
+                        "reason": f"Assumption '{assumption.name}' violated",
+                        "severity": 0.85
+                    }
+                )
+                journal.add_edge(contra_edge)
 
 
 class ScenarioType(Enum):
@@ -31,6 +268,9 @@ class ScenarioType(Enum):
 @dataclass
 class CounterfactualScenario:
     """Represents an alternate reality scenario"""
+    __slots__ = ("name", "scenario_type", "description", "criticality",
+                 "modifications", "metadata")
+    
     name: str
     scenario_type: ScenarioType
     description: str
@@ -42,6 +282,9 @@ class CounterfactualScenario:
 @dataclass
 class CounterfactualResult:
     """Result of testing a counterfactual scenario"""
+    __slots__ = ("scenario", "survived", "collapse_reason", "fii_after",
+                 "new_violations", "explanation")
+    
     scenario: CounterfactualScenario
     survived: bool
     collapse_reason: str
@@ -68,7 +311,8 @@ class CounterfactualSimulator:
     
     The simulator:
     1. Generates realistic counterfactual scenarios
-    2. Applies modifications to a copy of the reality graph
+    2. Applies modifications to the reality graph (journaled and rolled
+       back, or on a copy for arbitrary modification callables)
     3. Re-runs axiom verification and FII calculation
     4. Determines if the system survives
     """
@@ -114,9 +358,16 @@ class CounterfactualSimulator:
                 metadata={"failed_node": node.name}
             ))
         
+        # Bucket resources and assumptions in a single pass over the nodes
+        resource_nodes = []
+        assumptions = []
+        for node in self.base_graph.nodes.values():
+            if node.type == NodeType.RESOURCE:
+                resource_nodes.append(node)
+            elif node.type == NodeType.ASSUMPTION:
+                assumptions.append(node)
+        
         # Scenario: Human dependency removed
-        from core.reality_graph.graph_builder import NodeType
-        resource_nodes = self.base_graph.get_nodes_by_type(NodeType.RESOURCE)
         human_resources = [r for r in resource_nodes if "human" in r.name.lower() or "engineer" in r.name.lower()]
         
         for human in human_resources[:2]:  # Test key human dependencies
@@ -130,8 +381,6 @@ class CounterfactualSimulator:
             ))
         
         # Scenario: Key assumption violated
-        from core.reality_graph.graph_builder import NodeType
-        assumptions = self.base_graph.get_nodes_by_type(NodeType.ASSUMPTION)
         for assumption in assumptions[:3]:  # Test top assumptions
             self.scenarios.append(CounterfactualScenario(
                 name=f"Assumption Violated: {assumption.name}",
@@ -142,28 +391,49 @@ class CounterfactualSimulator:
                 metadata={"violated_assumption": assumption.name}
             ))
     
-    def run_simulation(self) -> List[CounterfactualResult]:
+    def run_simulation(self, max_workers: Optional[int] = None,
+                       fail_fast: bool = False) -> List[CounterfactualResult]:
         """
         Run all counterfactual scenarios.
         Returns list of results.
+        
+        Scenarios are independent, so with max_workers > 1 they are fanned
+        out over a process pool. Results keep the scenario order.
+        
+        With fail_fast, simulation stops at the first collapse under a
+        scenario of criticality >= 0.9 (enough to reject the system) and
+        only the results up to it are returned.
         """
         results = []
         
+        if max_workers is not None and max_workers > 1 and len(self.scenarios) > 1:
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                futures = [executor.submit(self._test_scenario, scenario)
+                           for scenario in self.scenarios]
+                for future in futures:
+                    result = future.result()
+                    results.append(result)
+                    if fail_fast and self._is_critical_collapse(result):
+                        for pending in futures:
+                            pending.cancel()
+                        break
+            return results
+        
         for scenario in self.scenarios:
             result = self._test_scenario(scenario)
             results.append(result)
+            if fail_fast and self._is_critical_collapse(result):
+                break
         
         return results
     
+    @staticmethod
+    def _is_critical_collapse(result: CounterfactualResult) -> bool:
+        """Whether a result alone is enough to reject the system"""
+        return not result.survived and result.scenario.criticality >= 0.9
+    
     def _test_scenario(self, scenario: CounterfactualScenario) -> CounterfactualResult:
         """Test a single counterfactual scenario"""
-        # Create a deep copy of the graph
-        test_graph = self._clone_graph(self.base_graph)
-        
-        # Apply modifications
-        for modification in scenario.modifications:
-            modification(test_graph)
-        
         # Re-run axiom verification
         from core.inevitability_index.fii_model import FIICalculator
         
@@ -172,11 +442,32 @@ class CounterfactualSimulator:
             "scenario": scenario.name
         }
         
-        violations = self.axiom_registry.verify_all(test_graph, context)
-        
-        # Calculate FII in this alternate reality
-        fii_calc = FIICalculator(test_graph, violations)
-        fii_after = fii_calc.compute()
+        if all(isinstance(m, _Edit) for m in scenario.modifications):
+            # Journaled edits run on the base graph and are rolled back,
+            # so the scenario never copies the graph
+            journal = _GraphJournal(self.base_graph)
+            try:
+                for modification in scenario.modifications:
+                    modification.apply(journal)
+                violations = self.axiom_registry.verify_all(
+                    self.base_graph, context, stop_on_fatal=False
+                )
+                
+                # Calculate FII in this alternate reality
+                fii_after = FIICalculator(self.base_graph, violations).compute()
+            finally:
+                journal.rollback()
+        else:
+            # Arbitrary callables may mutate anything: use a deep copy
+            test_graph = self._clone_graph(self.base_graph)
+            for modification in scenario.modifications:
+                modification(test_graph)
+            violations = self.axiom_registry.verify_all(
+                test_graph, context, stop_on_fatal=False
+            )
+            
+            # Calculate FII in this alternate reality
+            fii_after = FIICalculator(test_graph, violations).compute()
         
         # Determine if system survived
         fatal_violations = self.axiom_registry.get_fatal_violations(violations)
@@ -204,22 +495,22 @@ class CounterfactualSimulator:
     
     def _clone_graph(self, graph):
         """Create a deep copy of the reality graph"""
-        # Create new graph
-        new_graph = type(graph)()
-        
-        # Deep copy nodes
-        for node_id, node in graph.nodes.items():
-            new_node = copy.deepcopy(node)
-            new_graph.nodes[new_node.id] = new_node
-            new_graph._adjacency[new_node.id] = set()
-            new_graph._reverse_adjacency[new_node.id] = set()
-        
-        # Deep copy edges and rebuild adjacency
-        for edge_id, edge in graph.edges.items():
-            new_edge = copy.deepcopy(edge)
-            new_graph.edges[new_edge.id] = new_edge
-            new_graph._adjacency[new_edge.source].add(new_edge.id)
-            new_graph._reverse_adjacency[new_edge.target].add(new_edge.id)
+        # Create new graph; __init__ is skipped since every container it
+        # would allocate is assigned below
+        cls = type(graph)
+        new_graph = cls.__new__(cls)
+        
+        # Deep copy nodes and edges (IDs are preserved)
+        new_graph.nodes = {node_id: _fast_clone(node) for node_id, node in graph.nodes.items()}
+        new_graph.edges = {edge_id: _fast_clone(edge) for edge_id, edge in graph.edges.items()}
+        
+        # Edge IDs are unchanged, so each node's adjacency set is copied
+        # whole rather than rebuilt with two dict probes per edge
+        new_graph._adjacency = {node_id: set(edge_ids) for node_id, edge_ids in graph._adjacency.items()}
+        new_graph._reverse_adjacency = {
+            node_id: set(edge_ids) for node_id, edge_ids in graph._reverse_adjacency.items()
+        }
+        new_graph._version = None  # Modifications may edit the copy in place
         
         return new_graph
     
@@ -227,94 +518,19 @@ class CounterfactualSimulator:
     
     def _modify_traffic_spike(self, multiplier: float) -> Callable:
         """Generate a traffic spike modification"""
-        def modify(graph):
-            # Find load-bearing resources
-            from core.reality_graph.graph_builder import NodeType
-            resources = graph.get_nodes_by_type(NodeType.RESOURCE)
-            
-            for resource in resources:
-                if "cpu" in resource.name.lower() or "memory" in resource.name.lower():
-                    # Increase demand on this resource
-                    incoming = graph.get_incoming_edges(resource.id)
-                    for edge in incoming:
-                        source_node = graph.get_node(edge.source)
-                        if "resource_demand" in source_node.metadata:
-                            source_node.metadata["resource_demand"] *= multiplier
-        
-        return modify
+        return _Edit(_traffic_spike, multiplier)
     
     def _modify_node_failure(self, node_id: str) -> Callable:
         """Generate a node failure modification"""
-        def modify(graph):
-            # Remove the node and all its connected edges
-            if node_id in graph.nodes:
-                # Find all edges connected to this node
-                edges_to_remove = []
-                for edge_id, edge in list(graph.edges.items()):
-                    if edge.source == node_id or edge.target == node_id:
-                        edges_to_remove.append(edge_id)
-                
-                # Remove edges and clean up adjacency
-                for edge_id in edges_to_remove:
-                    edge = graph.edges[edge_id]
-                    # Clean up adjacency maps
-                    if edge.source in graph._adjacency:
-                        graph._adjacency[edge.source].discard(edge_id)
-                    if edge.target in graph._reverse_adjacency:
-                        graph._reverse_adjacency[edge.target].discard(edge_id)
-                    # Remove edge
-                    del graph.edges[edge_id]
-                
-                # Remove node and its adjacency entries
-                del graph.nodes[node_id]
-                if node_id in graph._adjacency:
-                    del graph._adjacency[node_id]
-                if node_id in graph._reverse_adjacency:
-                    del graph._reverse_adjacency[node_id]
-        
-        return modify
+        return _Edit(_node_failure, node_id)
     
     def _modify_remove_resource(self, resource_id: str) -> Callable:
         """Generate a resource removal modification"""
-        def modify(graph):
-            # Similar to node failure
-            if resource_id in graph.nodes:
-                # Mark resource as unavailable instead of removing
-                # (so we can trace dependencies)
-                resource = graph.get_node(resource_id)
-                resource.metadata["available"] = False
-                resource.metadata["capacity"] = 0
-        
-        return modify
+        return _Edit(_remove_resource, resource_id)
     
     def _modify_violate_assumption(self, assumption_id: str) -> Callable:
         """Generate an assumption violation modification"""
-        def modify(graph):
-            if assumption_id in graph.nodes:
-                assumption = graph.get_node(assumption_id)
-                
-                # Find all nodes that depend on this assumption
-                from core.reality_graph.graph_builder import EdgeType
-                outgoing = graph.get_outgoing_edges(assumption_id)
-                
-                for edge in outgoing:
-                    if edge.type == EdgeType.ASSUMES:
-                        # This node assumed something that's now false
-                        # Add a contradiction edge
-                        from core.reality_graph.graph_builder import Edge, EdgeType
-                        
-                        contra_edge = Edge(
-                            source=edge.target,
-                            target=assumption_id,
-                            type=EdgeType.CONTRADICTS,
-                            metadata={
-                                "reason": f"Assumption '{assumption.name}' violated",
-                                "severity": 0.85
-                            }
-                        )
-                        graph.add_edge(contra_edge)
-        
-        return modify
+        return _Edit(_violate_assumption, assumption_id)
     
     def get_failure_rate(self, results: List[CounterfactualResult]) -> float:
         """Calculate the failure rate across all scenarios"""
@@ -336,17 +552,24 @@ class CounterfactualSimulator:
             ""
         ]
         
+        # Tally outcomes and collect critical failures in one pass
         total = len(results)
-        survived = sum(1 for r in results if r.survived)
-        failed = total - survived
+        failed = 0
+        critical_failures = []
+        for r in results:
+            if not r.survived:
+                failed += 1
+                if r.scenario.criticality >= 0.7:
+                    critical_failures.append(r)
+        survived = total - failed
+        failure_rate = failed / total if total else 0.0
         
         lines.append(f"Total scenarios tested: {total}")
         lines.append(f"Survived: {survived}")
         lines.append(f"Failed: {failed}")
-        lines.append(f"Failure rate: {self.get_failure_rate(results):.1%}")
+        lines.append(f"Failure rate: {failure_rate:.1%}")
         lines.append("")
         
-        critical_failures = self.get_critical_failures(results)
         if critical_failures:
             lines.append(f"CRITICAL FAILURES ({len(critical_failures)}):")
             for result in critical_failures[:5]:
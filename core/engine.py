@@ -8,6 +8,13 @@ from typing import List, Dict, Any
 from .result import AnalysisResult
 from .context import ExecutionContext
 
+_NO_ID = object()  # MARKS A RULE WITHOUT AN ID ATTRIBUTE
+
+
+def _missing_evaluate(rule):
+    """DEFER THE MISSING-EVALUATE ERROR TO RUN TIME, WHERE IT IS REPORTED"""
+    return lambda data, context: rule.evaluate(data, context)
+
 
 class Engine:
     """
@@ -17,18 +24,32 @@ class Engine:
     
     VERSION = "1.0.0"
     
-    def __init__(self, rules: List = None):
+    _SEVERITY_EMOJI = {
+        'CRITICAL': '🚨',
+        'HIGH': '⚠️',
+        'MEDIUM': '⚡',
+        'LOW': '💡',
+        'INFO': 'ℹ️'
+    }
+    
+    def __init__(self, rules: List = None, verbose: bool = False, pace: bool = False):
         """
         INITIALIZE ENGINE WITH RULE SET
         
         Args:
             rules: List of rule instances to execute
+            verbose: Print progress output while running
+            pace: Pause between verbose progress lines (cosmetic)
         """
         self.rules = rules or []
         self.context = ExecutionContext()
-        print(f"\n🔧 ENGINE INITIALIZED", flush=True)
-        print(f"📋 LOADED {len(self.rules)} RULES", flush=True)
-        time.sleep(0.3)
+        self.verbose = verbose
+        self.pace = pace
+        self._index_rules()
+        if self.verbose:
+            print(f"\n🔧 ENGINE INITIALIZED", flush=True)
+            print(f"📋 LOADED {len(self.rules)} RULES", flush=True)
+            self._pause(0.3)
     
     def run(self, data: Dict[str, Any], target: str = "unknown") -> AnalysisResult:
         """
@@ -41,71 +62,79 @@ class Engine:
         Returns:
             AnalysisResult object with verdict, score, and findings
         """
-        print(f"\n⚡ STARTING ANALYSIS ENGINE...", flush=True)
-        print(f"🎯 TARGET: {target.upper()}", flush=True)
-        time.sleep(0.4)
+        if self.verbose:
+            print(f"\n⚡ STARTING ANALYSIS ENGINE...", flush=True)
+            print(f"🎯 TARGET: {target.upper()}", flush=True)
+            self._pause(0.4)
         
         result = AnalysisResult()
         result.target = target
         result.engine_version = self.VERSION
         
-        # EXECUTE EACH RULE
-        print(f"\n🔍 EXECUTING VALIDATION RULES...", flush=True)
-        time.sleep(0.3)
+        if (len(self._rule_meta) != len(self.rules)
+                or any(meta[0] is not rule for meta, rule in zip(self._rule_meta, self.rules))):
+            self._index_rules()  # RULES LIST WAS MODIFIED DIRECTLY
         
-        rule_categories = {}
-        for rule in self.rules:
-            category = getattr(rule, 'category', 'GENERAL')
-            rule_categories[category] = rule_categories.get(category, 0) + 1
+        # SCANS SHARED BY RULES BELONG TO THIS RUN'S DATA ONLY
+        self.context.clear_run_cache()
         
-        for category, count in rule_categories.items():
-            print(f"   ✓ {category}: {count} RULES", flush=True)
-            time.sleep(0.15)
-        
-        print(f"\n⚙️  PROCESSING...", flush=True)
-        time.sleep(0.5)
+        # EXECUTE EACH RULE
+        if self.verbose:
+            print(f"\n🔍 EXECUTING VALIDATION RULES...", flush=True)
+            self._pause(0.3)
+            
+            for category, count in self._rule_categories.items():
+                print(f"   ✓ {category}: {count} RULES", flush=True)
+                self._pause(0.15)
+            
+            print(f"\n⚙️  PROCESSING...", flush=True)
+            self._pause(0.5)
         
-        for i, rule in enumerate(self.rules, 1):
+        for rule, rule_id, evaluate in self._rule_meta:
             try:
-                finding = rule.evaluate(data, self.context)
+                finding = evaluate(data, self.context)
                 if finding:
                     result.add_finding(finding)
-                    severity = finding.get('severity', 'UNKNOWN')
-                    emoji = self._get_severity_emoji(severity)
-                    print(f"   {emoji} FINDING: {severity} [{finding.get('id', 'N/A')}]", flush=True)
-                    time.sleep(0.1)
+                    if self.verbose:
+                        severity = finding.get('severity', 'UNKNOWN')
+                        emoji = self._get_severity_emoji(severity)
+                        print(f"   {emoji} FINDING: {severity} [{finding.get('id', 'N/A')}]", flush=True)
+                        self._pause(0.1)
             except Exception as e:
                 # LOG RULE EXECUTION FAILURE
                 result.add_finding({
                     "id": "ENGINE-ERROR",
                     "severity": "CRITICAL",
-                    "rule": rule.id if hasattr(rule, 'id') else str(rule),
+                    "rule": rule_id if rule_id is not _NO_ID else str(rule),
                     "message": f"RULE EXECUTION FAILED: {str(e)}"
                 })
-                print(f"   ❌ ERROR IN RULE: {rule.id if hasattr(rule, 'id') else 'UNKNOWN'}", flush=True)
-                time.sleep(0.1)
+                if self.verbose:
+                    print(f"   ❌ ERROR IN RULE: {rule_id if rule_id is not _NO_ID else 'UNKNOWN'}", flush=True)
+                    self._pause(0.1)
+        
+        self.context.clear_run_cache()  # DO NOT PIN THIS RUN'S DATA
         
         # FINALIZE VERDICT AND SCORING
-        print(f"\n🧮 CALCULATING FINAL VERDICT...", flush=True)
-        time.sleep(0.4)
+        if self.verbose:
+            print(f"\n🧮 CALCULATING FINAL VERDICT...", flush=True)
+            self._pause(0.4)
         
         self._finalize(result)
         
-        print(f"✅ ANALYSIS COMPLETE!", flush=True)
-        time.sleep(0.2)
+        if self.verbose:
+            print(f"✅ ANALYSIS COMPLETE!", flush=True)
+            self._pause(0.2)
         
         return result
     
+    def _pause(self, seconds: float) -> None:
+        """SLEEP BETWEEN PROGRESS LINES ONLY WHEN PACING IS ENABLED"""
+        if self.pace:
+            time.sleep(seconds)
+    
     def _get_severity_emoji(self, severity: str) -> str:
         """GET EMOJI FOR SEVERITY LEVEL"""
-        emoji_map = {
-            'CRITICAL': '🚨',
-            'HIGH': '⚠️',
-            'MEDIUM': '⚡',
-            'LOW': '💡',
-            'INFO': 'ℹ️'
-        }
-        return emoji_map.get(severity, '•')
+        return self._SEVERITY_EMOJI.get(severity, '•')
     
     def _finalize(self, result: AnalysisResult) -> None:
         """
@@ -114,11 +143,12 @@ class Engine:
         Args:
             result: AnalysisResult to finalize
         """
-        # COUNT SEVERITY LEVELS
-        critical_count = sum(1 for f in result.findings if f.get("severity") == "CRITICAL")
-        high_count = sum(1 for f in result.findings if f.get("severity") == "HIGH")
-        medium_count = sum(1 for f in result.findings if f.get("severity") == "MEDIUM")
-        low_count = sum(1 for f in result.findings if f.get("severity") == "LOW")
+        # COUNT SEVERITY LEVELS (TALLIED AS FINDINGS WERE ADDED)
+        counts = result.severity_counts()
+        critical_count = counts["CRITICAL"]
+        high_count = counts["HIGH"]
+        medium_count = counts["MEDIUM"]
+        low_count = counts["LOW"]
         
         # CALCULATE SCORE PENALTIES
         score_penalty = 0
@@ -134,29 +164,35 @@ class Engine:
             result.verdict = "FAILED"
             result.risk = "CRITICAL"
             result.confidence = 1.0
-            print(f"   🚨 CRITICAL ISSUES DETECTED: {critical_count}", flush=True)
+            if self.verbose:
+                print(f"   🚨 CRITICAL ISSUES DETECTED: {critical_count}", flush=True)
         elif high_count > 0:
             result.verdict = "FAILED"
             result.risk = "HIGH"
             result.confidence = 0.95
-            print(f"   ⚠️  HIGH SEVERITY ISSUES: {high_count}", flush=True)
+            if self.verbose:
+                print(f"   ⚠️  HIGH SEVERITY ISSUES: {high_count}", flush=True)
         elif medium_count > 0:
             result.verdict = "WARNING"
             result.risk = "MEDIUM"
             result.confidence = 0.85
-            print(f"   ⚡ MEDIUM ISSUES DETECTED: {medium_count}", flush=True)
+            if self.verbose:
+                print(f"   ⚡ MEDIUM ISSUES DETECTED: {medium_count}", flush=True)
         elif low_count > 0:
             result.verdict = "PASSED"
             result.risk = "LOW"
             result.confidence = 0.90
-            print(f"   💡 MINOR ISSUES FOUND: {low_count}", flush=True)
+            if self.verbose:
+                print(f"   💡 MINOR ISSUES FOUND: {low_count}", flush=True)
         else:
             result.verdict = "PASSED"
             result.risk = "NONE"
             result.confidence = 1.0
-            print(f"   ✨ NO ISSUES DETECTED - PERFECT!", flush=True)
+            if self.verbose:
+                print(f"   ✨ NO ISSUES DETECTED - PERFECT!", flush=True)
         
-        time.sleep(0.2)
+        if self.verbose:
+            self._pause(0.2)
         
         # STORE METADATA
         result.metadata = {
@@ -171,6 +207,18 @@ class Engine:
     def add_rule(self, rule) -> None:
         """ADD A RULE TO THE ENGINE"""
         self.rules.append(rule)
+        self._index_rules()
+    
+    def _index_rules(self) -> None:
+        """PRECOMPUTE PER-RULE DISPATCH DATA AND CATEGORY COUNTS"""
+        self._rule_meta = [
+            (rule, getattr(rule, 'id', _NO_ID), getattr(rule, 'evaluate', None) or _missing_evaluate(rule))
+            for rule in self.rules
+        ]
+        self._rule_categories = {}
+        for rule in self.rules:
+            category = getattr(rule, 'category', 'GENERAL')
+            self._rule_categories[category] = self._rule_categories.get(category, 0) + 1
     
     def __repr__(self) -> str:
         return f"<ENGINE v{self.VERSION} RULES={len(self.rules)}>"
@@ -20,10 +20,18 @@ FII Scale:
 0.90 - 1.00: Absolute inevitability (already failed)
 """
 
+import math
 from dataclasses import dataclass
-from typing import List, Dict, Any, Set
+from typing import List, Dict, Any, Set, Iterator, Optional
 from enum import Enum
 
+from core.reality_graph.graph_builder import NodeType, EdgeType
+
+
+# Edge types walked by the deadlock and cascade analyses
+_DEPENDENCY_EDGES = frozenset({EdgeType.REQUIRES, EdgeType.DEPENDS_ON})
+_CASCADE_EDGES = frozenset({EdgeType.CAUSES, EdgeType.ENABLES})
+
 
 class CollapsePathType(Enum):
     """Types of paths that lead to system collapse"""
@@ -39,6 +47,8 @@ class CollapsePathType(Enum):
 @dataclass
 class CollapsePath:
     """Represents a path that leads to system collapse"""
+    __slots__ = ("path_type", "nodes", "certainty", "explanation", "metadata")
+    
     path_type: CollapsePathType
     nodes: List[str]  # Node IDs in the path
     certainty: float  # 0.0 - 1.0
@@ -46,6 +56,64 @@ class CollapsePath:
     metadata: Dict[str, Any]
 
 
+def _strongly_connected_components(successors: Dict[str, List[str]]) -> Iterator[List[str]]:
+    """
+    Yield the strongly connected components of a graph given as
+    node_id -> successor IDs, using an iterative Tarjan pass.
+    
+    Components are yielded in reverse topological order (each one after
+    every component reachable from it), members in discovery order.
+    """
+    index: Dict[str, int] = {}
+    lowlink: Dict[str, int] = {}
+    on_stack: Set[str] = set()
+    scc_stack: List[str] = []
+    
+    for root in successors:
+        if root in index:
+            continue
+        
+        index[root] = lowlink[root] = len(index)
+        scc_stack.append(root)
+        on_stack.add(root)
+        work = [(root, iter(successors[root]))]
+        
+        while work:
+            node_id, targets = work[-1]
+            for target in targets:
+                if target not in index:
+                    # Descend; resume this node's iterator afterwards
+                    index[target] = lowlink[target] = len(index)
+                    scc_stack.append(target)
+                    on_stack.add(target)
+                    work.append((target, iter(successors[target])))
+                    break
+                if target in on_stack:
+                    lowlink[node_id] = min(lowlink[node_id], index[target])
+            else:
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    lowlink[parent] = min(lowlink[parent], lowlink[node_id])
+                
+                if lowlink[node_id] == index[node_id]:
+                    # node_id is the root of a component
+                    component = []
+                    while True:
+                        member = scc_stack.pop()
+                        on_stack.remove(member)
+                        component.append(member)
+                        if member == node_id:
+                            break
+                    component.reverse()
+                    yield component
+
+
+def _popcount(mask: int) -> int:
+    """Number of set bits (int.bit_count() needs Python 3.10)"""
+    return bin(mask).count("1")
+
+
 class FIICalculator:
     """
     Calculates Failure Inevitability Index.
@@ -61,6 +129,9 @@ class FIICalculator:
         self.graph = reality_graph
         self.violations = axiom_violations
         self.collapse_paths: List[CollapsePath] = []
+        # Dependents bitmask per node, rebuilt for each _identify_collapse_paths() run
+        self._reach: Optional[Dict[str, int]] = None
+        self._node_order: List[str] = []
     
     def compute(self) -> float:
         """
@@ -87,10 +158,10 @@ class FIICalculator:
     def _identify_collapse_paths(self):
         """Identify all paths in the graph that lead to collapse"""
         self.collapse_paths = []
+        self._reach = None
         
         # Find contradiction-based collapse paths
-        contradictions = self.graph.find_contradictions()
-        for c in contradictions:
+        for c in self.graph.iter_contradictions():
             self.collapse_paths.append(CollapsePath(
                 path_type=CollapsePathType.CONTRADICTION,
                 nodes=c.causal_chain,
@@ -99,40 +170,48 @@ class FIICalculator:
                 metadata={"source": c.node_a.name, "target": c.node_b.name}
             ))
         
-        # Find resource exhaustion paths
-        resource_paths = self._find_resource_exhaustion_paths()
-        self.collapse_paths.extend(resource_paths)
-        
-        # Find cascading failure paths
-        cascade_paths = self._find_cascading_failure_paths()
-        self.collapse_paths.extend(cascade_paths)
+        # Edge types present in this graph; analyses that only walk
+        # absent edge types cannot find anything and are skipped
+        edge_types = {edge.type for edge in self.graph.edges.values()}
         
-        # Find single point of failure paths
-        spof_paths = self._find_spof_paths()
-        self.collapse_paths.extend(spof_paths)
+        # Find resource exhaustion paths
+        if EdgeType.REQUIRES in edge_types:
+            resource_paths = self._find_resource_exhaustion_paths()
+            self.collapse_paths.extend(resource_paths)
+        
+        if not edge_types.isdisjoint(_CASCADE_EDGES):
+            # Find cascading failure paths
+            cascade_paths = self._find_cascading_failure_paths()
+            self.collapse_paths.extend(cascade_paths)
+            
+            # Find single point of failure paths
+            spof_paths = self._find_spof_paths()
+            self.collapse_paths.extend(spof_paths)
         
         # Find deadlock paths
-        deadlock_paths = self._find_deadlock_paths()
-        self.collapse_paths.extend(deadlock_paths)
+        if not edge_types.isdisjoint(_DEPENDENCY_EDGES):
+            deadlock_paths = self._find_deadlock_paths()
+            self.collapse_paths.extend(deadlock_paths)
     
     def _find_resource_exhaustion_paths(self) -> List[CollapsePath]:
         """Find paths where resources are exhausted"""
         paths = []
-        resource_nodes = self.graph.get_nodes_by_type(
-            __import__('core.reality_graph.graph_builder', fromlist=['NodeType']).NodeType.RESOURCE
-        )
+        resource_nodes = self.graph.get_nodes_by_type(NodeType.RESOURCE)
+        
+        nodes = self.graph.nodes
         
         for resource in resource_nodes:
-            capacity = resource.metadata.get("capacity", float('inf'))
-            
-            # Find all consumers of this resource
-            incoming = self.graph.get_incoming_edges(resource.id)
-            requires_edges = [e for e in incoming if e.type.value == "requires"]
+            # Find all consumers of this resource (source IDs, in edge order)
+            consumer_ids = [
+                e.source for e in self.graph.get_incoming_edges(resource.id)
+                if e.type == EdgeType.REQUIRES
+            ]
             
-            if len(requires_edges) > 0:
+            if consumer_ids:
+                capacity = resource.metadata.get("capacity", float('inf'))
                 total_demand = sum(
-                    self.graph.get_node(e.source).metadata.get("resource_demand", 1)
-                    for e in requires_edges
+                    nodes[source].metadata.get("resource_demand", 1)
+                    for source in consumer_ids
                 )
                 
                 if total_demand > capacity:
@@ -142,7 +221,7 @@ class FIICalculator:
                         certainty = 1.0  # Resource completely unavailable
                     paths.append(CollapsePath(
                         path_type=CollapsePathType.RESOURCE_EXHAUSTION,
-                        nodes=[e.source for e in requires_edges] + [resource.id],
+                        nodes=consumer_ids + [resource.id],
                         certainty=certainty,
                         explanation=f"Resource '{resource.name}' exhausted: demand {total_demand} > capacity {capacity}",
                         metadata={
@@ -162,18 +241,19 @@ class FIICalculator:
         
         for node in critical_nodes:
             # Find all nodes that depend on this critical node
-            dependents = self._find_all_dependents(node.id)
+            dependents = self._dependents_mask(node.id)
+            cascade_size = _popcount(dependents)
             
-            if len(dependents) > 3:  # Significant cascade potential
-                certainty = min(0.9, len(dependents) / 10.0)
+            if cascade_size > 3:  # Significant cascade potential
+                certainty = min(0.9, cascade_size / 10.0)
                 paths.append(CollapsePath(
                     path_type=CollapsePathType.CASCADING_FAILURE,
-                    nodes=[node.id] + list(dependents),
+                    nodes=[node.id] + self._ids_in_mask(dependents),
                     certainty=certainty,
-                    explanation=f"Failure of '{node.name}' cascades to {len(dependents)} components",
+                    explanation=f"Failure of '{node.name}' cascades to {cascade_size} components",
                     metadata={
                         "trigger": node.name,
-                        "cascade_size": len(dependents),
+                        "cascade_size": cascade_size,
                         "criticality": node.criticality
                     }
                 ))
@@ -185,104 +265,129 @@ class FIICalculator:
         paths = []
         nodes = self.graph.nodes.values()
         
+        # Bitmask of critical nodes, in the same bit order as dependents
+        critical_mask = 0
+        for i, node in enumerate(nodes):
+            if node.criticality > 0.7:
+                critical_mask |= 1 << i
+        
         for node in nodes:
             # A node is a SPOF if:
             # 1. It has no redundancy
             # 2. Multiple critical components depend on it
-            dependents = self._find_all_dependents(node.id)
-            critical_dependents = [
-                d for d in dependents
-                if self.graph.get_node(d).criticality > 0.7
-            ]
+            critical_dependents = self._dependents_mask(node.id) & critical_mask
+            critical_count = _popcount(critical_dependents)
             
             has_redundancy = node.metadata.get("has_redundancy", False)
             
-            if not has_redundancy and len(critical_dependents) > 1:
-                certainty = min(0.95, 0.7 + len(critical_dependents) * 0.05)
+            if not has_redundancy and critical_count > 1:
+                certainty = min(0.95, 0.7 + critical_count * 0.05)
                 paths.append(CollapsePath(
-                    path_type=CollapsePathType.HUMAN_DEPENDENCY if node.type.value == "resource" else CollapsePathType.CASCADING_FAILURE,
-                    nodes=[node.id] + list(critical_dependents),
+                    path_type=CollapsePathType.HUMAN_DEPENDENCY if node.type == NodeType.RESOURCE else CollapsePathType.CASCADING_FAILURE,
+                    nodes=[node.id] + self._ids_in_mask(critical_dependents),
                     certainty=certainty,
-                    explanation=f"'{node.name}' is a single point of failure for {len(critical_dependents)} critical components",
+                    explanation=f"'{node.name}' is a single point of failure for {critical_count} critical components",
                     metadata={
                         "spof": node.name,
-                        "critical_dependents": len(critical_dependents)
+                        "critical_dependents": critical_count
                     }
                 ))
         
         return paths
     
     def _find_deadlock_paths(self) -> List[CollapsePath]:
-        """Find potential deadlock cycles"""
+        """
+        Find potential deadlock cycles.
+        
+        Every strongly connected component of the requires/depends_on
+        subgraph with more than one node (or a self-dependency) is a
+        deadlock. Components are found with an iterative Tarjan pass, so
+        all of them are reported and deep graphs cannot hit the recursion
+        limit.
+        """
         paths = []
-        visited = set()
-        rec_stack = set()
-        current_path = []
-        
-        def has_cycle(node_id: str) -> bool:
-            visited.add(node_id)
-            rec_stack.add(node_id)
-            current_path.append(node_id)
-            
-            for edge in self.graph.get_outgoing_edges(node_id):
-                if edge.type.value in ["requires", "depends_on"]:
-                    target = edge.target
-                    if target not in visited:
-                        if has_cycle(target):
-                            return True
-                    elif target in rec_stack:
-                        # Found a cycle
-                        cycle_start = current_path.index(target)
-                        cycle = current_path[cycle_start:]
-                        paths.append(CollapsePath(
-                            path_type=CollapsePathType.DEADLOCK,
-                            nodes=cycle,
-                            certainty=0.8,
-                            explanation=f"Circular dependency detected: {' → '.join(self.graph.get_node(n).name for n in cycle)}",
-                            metadata={"cycle": cycle}
-                        ))
-                        return True
-            
-            current_path.pop()
-            rec_stack.remove(node_id)
-            return False
         
-        for node_id in self.graph.nodes:
-            if node_id not in visited:
-                has_cycle(node_id)
+        # Dependency successors of each node
+        successors = self.graph.successor_lists(_DEPENDENCY_EDGES)
+        
+        for cycle in _strongly_connected_components(successors):
+            if len(cycle) > 1 or cycle[0] in successors[cycle[0]]:
+                # Discovery order follows the cycle
+                paths.append(CollapsePath(
+                    path_type=CollapsePathType.DEADLOCK,
+                    nodes=cycle,
+                    certainty=0.8,
+                    explanation=f"Circular dependency detected: {' → '.join(self.graph.get_node(n).name for n in cycle)}",
+                    metadata={"cycle": cycle}
+                ))
         
         return paths
     
     def _find_all_dependents(self, node_id: str) -> Set[str]:
         """Find all nodes that depend on the given node"""
-        dependents = set()
-        visited = set()
-        stack = [node_id]
-        
-        while stack:
-            current = stack.pop()
-            if current in visited:
-                continue
-            visited.add(current)
-            
-            for edge in self.graph.get_outgoing_edges(current):
-                if edge.type.value in ["causes", "enables"]:
-                    dependents.add(edge.target)
-                    stack.append(edge.target)
+        return set(self._ids_in_mask(self._dependents_mask(node_id)))
+    
+    def _dependents_mask(self, node_id: str) -> int:
+        """
+        Dependents of a node as a bitmask over graph node order.
+        The closure for every node is built once per analysis run.
+        """
+        if self._reach is None:
+            self._build_reach()
+        return self._reach[node_id]
+    
+    def _build_reach(self):
+        """
+        Compute, for every node, the bitmask of nodes reachable from it
+        over causes/enables edges (its dependents).
         
-        return dependents
+        Components of that subgraph arrive in reverse topological order,
+        so each one's reach is the union of its successors' bits and their
+        already computed reach. Members of a cycle share one mask.
+        """
+        self._node_order = list(self.graph.nodes)
+        bit = {node_id: 1 << i for i, node_id in enumerate(self._node_order)}
+        
+        successors = self.graph.successor_lists(_CASCADE_EDGES)
+        
+        reach: Dict[str, int] = {}
+        for component in _strongly_connected_components(successors):
+            mask = 0
+            for node_id in component:
+                for target in successors[node_id]:
+                    # Targets inside this component have no reach yet; their
+                    # bits alone already cover the whole cycle
+                    mask |= bit[target] | reach.get(target, 0)
+            for node_id in component:
+                reach[node_id] = mask
+        
+        self._reach = reach
+    
+    def _ids_in_mask(self, mask: int) -> List[str]:
+        """Node IDs whose bits are set in mask, in graph node order"""
+        # Render the mask once and let str.find skip runs of zero bits in C;
+        # peeling bits off the int instead costs a full bigint op per bit
+        bits = bin(mask)[:1:-1]  # Least significant bit first
+        order = self._node_order
+        ids = []
+        i = bits.find("1")
+        while i != -1:
+            ids.append(order[i])
+            i = bits.find("1", i + 1)
+        return ids
     
     def _compute_base_fii(self) -> float:
         """Compute base FII from collapse paths"""
         if not self.collapse_paths:
             return 0.0
         
-        # Use logical OR combination: P(A or B) = P(A) + P(B) - P(A)*P(B)
-        combined_certainty = 0.0
-        for path in self.collapse_paths:
-            combined_certainty = combined_certainty + path.certainty - (combined_certainty * path.certainty)
-        
-        return combined_certainty
+        # Use logical OR combination: P(A or B) = P(A) + P(B) - P(A)*P(B),
+        # which over all paths is 1 - Π(1 - p). Summing log1p(-p) with fsum
+        # keeps many small certainties from being lost to rounding.
+        certainties = [path.certainty for path in self.collapse_paths]
+        if max(certainties) >= 1.0:
+            return 1.0
+        return -math.expm1(math.fsum(math.log1p(-p) for p in certainties))
     
     def _compute_violation_adjustment(self) -> float:
         """Compute adjustment based on axiom violations"""
@@ -9,11 +9,36 @@ This is a CAUSAL REALITY MODEL.
 """
 
 from enum import Enum
-from typing import Optional, List, Set, Dict, Any
+from typing import Optional, List, Set, Dict, Any, Iterable, Iterator
 from dataclasses import dataclass, field
+import hashlib
+import itertools
+import json
+import os
+import sys
 import uuid
 
 
+# Graph records are allocated per node/edge, so they drop the per-instance
+# __dict__ where dataclasses support it (slots=True needs Python 3.10)
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+# Default node/edge IDs: a random per-process prefix plus a counter.
+# As unique in practice as uuid4(), without os.urandom and formatting per object.
+_ID_PREFIX = uuid.uuid4().hex[:12]
+_id_counter = itertools.count()
+
+# Graph versions: the process ID keeps tokens minted in worker processes
+# distinct from those of the parent
+_version_counter = itertools.count()
+
+
+def _next_id() -> str:
+    """Generate a default node/edge ID"""
+    return f"{_ID_PREFIX}-{next(_id_counter)}"
+
+
 class NodeType(Enum):
     """Types of nodes in the reality graph"""
     DECISION = "decision"              # Explicit engineering decision
@@ -37,10 +62,14 @@ class EdgeType(Enum):
     ASSUMES = "assumes"                # A assumes B is true
 
 
-@dataclass
+# Edge types followed by compute_causal_paths
+_CAUSAL_EDGES = frozenset({EdgeType.CAUSES, EdgeType.ENABLES, EdgeType.REQUIRES})
+
+
+@dataclass(**_SLOTS)
 class Node:
     """A node in the reality graph"""
-    id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = field(default_factory=_next_id)
     type: NodeType = NodeType.DECISION
     name: str = ""
     description: str = ""
@@ -54,10 +83,10 @@ class Node:
         return isinstance(other, Node) and self.id == other.id
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class Edge:
     """An edge in the reality graph"""
-    id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = field(default_factory=_next_id)
     source: str = ""  # Source node ID
     target: str = ""  # Target node ID
     type: EdgeType = EdgeType.CAUSES
@@ -72,7 +101,7 @@ class Edge:
         return isinstance(other, Edge) and self.id == other.id
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class Contradiction:
     """Represents a detected contradiction between nodes"""
     node_a: Node
@@ -108,10 +137,27 @@ class RealityGraph:
         self.edges: Dict[str, Edge] = {}
         self._adjacency: Dict[str, Set[str]] = {}  # node_id -> set of edge_ids
         self._reverse_adjacency: Dict[str, Set[str]] = {}  # reverse edges
+        self._version = None  # Minted lazily by the version property
+    
+    @property
+    def version(self):
+        """
+        Token identifying the graph's current contents, for memoization.
+        add_node/add_edge issue a new one; code that edits nodes or edges
+        in place must call touch().
+        """
+        if self._version is None:
+            self._version = (os.getpid(), next(_version_counter))
+        return self._version
+    
+    def touch(self) -> None:
+        """Mark the graph as modified, so its next version is new"""
+        self._version = None
     
     def add_node(self, node: Node) -> Node:
         """Add a node to the graph"""
         self.nodes[node.id] = node
+        self._version = None
         if node.id not in self._adjacency:
             self._adjacency[node.id] = set()
         if node.id not in self._reverse_adjacency:
@@ -127,6 +173,7 @@ class RealityGraph:
             raise ValueError(f"Target node {edge.target} not found")
         
         self.edges[edge.id] = edge
+        self._version = None
         self._adjacency[edge.source].add(edge.id)
         self._reverse_adjacency[edge.target].add(edge.id)
         return edge
@@ -149,6 +196,19 @@ class RealityGraph:
         edge_ids = self._reverse_adjacency.get(node_id, set())
         return [self.edges[eid] for eid in edge_ids]
     
+    def successor_lists(self, edge_types: Iterable[EdgeType]) -> Dict[str, List[str]]:
+        """
+        Successor node IDs of every node over the given edge types, in edge order.
+        Built in one pass over the edges, so traversals walk plain lists
+        instead of resolving each edge ID through the adjacency sets.
+        """
+        wanted = frozenset(edge_types)
+        successors: Dict[str, List[str]] = {node_id: [] for node_id in self.nodes}
+        for edge in self.edges.values():
+            if edge.type in wanted:
+                successors[edge.source].append(edge.target)
+        return successors
+    
     def get_nodes_by_type(self, node_type: NodeType) -> List[Node]:
         """Get all nodes of a specific type"""
         return [n for n in self.nodes.values() if n.type == node_type]
@@ -194,35 +254,36 @@ class RealityGraph:
         2. Two decisions require mutually exclusive resources
         3. Two constraints cannot be satisfied simultaneously
         """
-        contradictions = []
-        
+        return list(self.iter_contradictions())
+    
+    def iter_contradictions(self) -> Iterator[Contradiction]:
+        """
+        Yield contradictions one at a time, in find_contradictions() order.
+        For single-pass consumers: the pairwise pattern matches are never
+        held in a list.
+        """
         # Find explicit contradictions
         for edge in self.edges.values():
             if edge.type == EdgeType.CONTRADICTS:
                 source = self.nodes[edge.source]
                 target = self.nodes[edge.target]
                 
-                contradictions.append(Contradiction(
+                yield Contradiction(
                     node_a=source,
                     node_b=target,
                     explanation=edge.metadata.get("reason", "Explicit contradiction"),
                     severity=edge.metadata.get("severity", 0.9),
                     causal_chain=[source.name, "contradicts", target.name]
-                ))
+                )
         
         # Find resource contradictions
-        resource_contradictions = self._find_resource_contradictions()
-        contradictions.extend(resource_contradictions)
+        yield from self._find_resource_contradictions()
         
         # Find logical contradictions (e.g., HA + Single DB)
-        logical_contradictions = self._find_logical_contradictions()
-        contradictions.extend(logical_contradictions)
-        
-        return contradictions
+        yield from self._find_logical_contradictions()
     
-    def _find_resource_contradictions(self) -> List[Contradiction]:
+    def _find_resource_contradictions(self) -> Iterator[Contradiction]:
         """Find contradictions in resource allocation"""
-        contradictions = []
         resource_nodes = self.get_nodes_by_type(NodeType.RESOURCE)
         
         for resource in resource_nodes:
@@ -238,7 +299,7 @@ class RealityGraph:
                 total_demand = sum(c.metadata.get("resource_demand", 1) for c in consumers)
                 
                 if total_demand > capacity:
-                    contradictions.append(Contradiction(
+                    yield Contradiction(
                         node_a=consumers[0],
                         node_b=consumers[1] if len(consumers) > 1 else consumers[0],
                         explanation=f"Resource '{resource.name}' oversubscribed: {total_demand} > {capacity}",
@@ -249,79 +310,103 @@ class RealityGraph:
                             consumers[1].name if len(consumers) > 1 else "self",
                             "resource_exhausted"
                         ]
-                    ))
-        
-        return contradictions
+                    )
     
-    def _find_logical_contradictions(self) -> List[Contradiction]:
+    def _find_logical_contradictions(self) -> Iterator[Contradiction]:
         """
         Find logical contradictions like:
         - High Availability + Single Point of Failure
         - Zero Downtime + Manual Deployment
         - Stateless + In-Memory Cache
         """
-        contradictions = []
         decisions = self.get_decision_nodes()
         
-        # Pattern: HA + Single DB
-        ha_decisions = [d for d in decisions if "high" in d.name.lower() and "availab" in d.name.lower()]
-        single_points = [d for d in decisions if "single" in d.name.lower()]
+        # Classify decisions by name in one pass, lower-casing each name once
+        ha_decisions = []
+        single_points = []
+        stateless = []
+        stateful = []
+        for d in decisions:
+            name = d.name.lower()
+            if "high" in name and "availab" in name:
+                ha_decisions.append(d)
+            if "single" in name:
+                single_points.append(d)
+            if "stateless" in name:
+                stateless.append(d)
+            elif "state" in name:
+                stateful.append(d)
         
+        # Pattern: HA + Single DB
         for ha in ha_decisions:
             for sp in single_points:
-                contradictions.append(Contradiction(
+                yield Contradiction(
                     node_a=ha,
                     node_b=sp,
                     explanation=f"High availability cannot coexist with single point of failure",
                     severity=0.95,
                     causal_chain=[ha.name, "requires_redundancy", sp.name, "lacks_redundancy"]
-                ))
+                )
         
         # Pattern: Stateless + Stateful resource
-        stateless = [d for d in decisions if "stateless" in d.name.lower()]
-        stateful = [d for d in decisions if "state" in d.name.lower() and "stateless" not in d.name.lower()]
-        
         for sl in stateless:
             for sf in stateful:
-                contradictions.append(Contradiction(
+                yield Contradiction(
                     node_a=sl,
                     node_b=sf,
                     explanation=f"Stateless architecture contradicts stateful component",
                     severity=0.7,
                     causal_chain=[sl.name, "requires_no_state", sf.name, "maintains_state"]
-                ))
-        
-        return contradictions
+                )
     
-    def compute_causal_paths(self, from_node_id: str, to_node_id: str) -> List[List[str]]:
+    def compute_causal_paths(self, from_node_id: str, to_node_id: str,
+                             max_depth: Optional[int] = None,
+                             max_paths: Optional[int] = None) -> List[List[str]]:
         """
         Compute all causal paths from one node to another.
         Returns list of paths, where each path is a list of node IDs.
+        
+        The number of simple paths can grow exponentially; max_depth caps
+        the edges per path and max_paths stops after that many paths.
         """
+        if from_node_id == to_node_id:
+            return [[from_node_id]]
+        
         paths = []
-        visited = set()
-        current_path = []
+        current_path = [from_node_id]
+        on_path = {from_node_id}
         
-        def dfs(node_id: str):
-            if node_id in visited:
-                return
-            
-            visited.add(node_id)
-            current_path.append(node_id)
-            
-            if node_id == to_node_id:
-                paths.append(list(current_path))
-            else:
-                for edge in self.get_outgoing_edges(node_id):
-                    if edge.type in [EdgeType.CAUSES, EdgeType.ENABLES, EdgeType.REQUIRES]:
-                        dfs(edge.target)
+        # Iterative DFS: one iterator of causal successors per path node
+        stack = [self._causal_successors(from_node_id)]
+        while stack:
+            target = next(stack[-1], None)
+            if target is None:
+                stack.pop()
+                on_path.remove(current_path.pop())
+                continue
+            if target in on_path:
+                continue
             
-            current_path.pop()
-            visited.remove(node_id)
+            # Reaching target adds edge number len(current_path)
+            if target == to_node_id:
+                if max_depth is None or len(current_path) <= max_depth:
+                    paths.append(current_path + [target])
+                    if max_paths is not None and len(paths) >= max_paths:
+                        break
+            elif max_depth is None or len(current_path) < max_depth:
+                current_path.append(target)
+                on_path.add(target)
+                stack.append(self._causal_successors(target))
         
-        dfs(from_node_id)
         return paths
     
+    def _causal_successors(self, node_id: str) -> Iterator[str]:
+        """Targets of a node's causes/enables/requires edges"""
+        return (
+            edge.target for edge in self.get_outgoing_edges(node_id)
+            if edge.type in _CAUSAL_EDGES
+        )
+    
     def get_critical_nodes(self, threshold: float = 0.7) -> List[Node]:
         """Get nodes with criticality above threshold"""
         return [n for n in self.nodes.values() if n.criticality >= threshold]
@@ -354,14 +439,31 @@ class RealityGraph:
             ]
         }
     
+    def fingerprint(self) -> str:
+        """
+        Content hash of the graph.
+        Two graphs with the same nodes, edges and metadata share a fingerprint;
+        any modification (e.g. a counterfactual scenario) changes it.
+        """
+        content = json.dumps(self.to_dict(), sort_keys=True, default=str)
+        return hashlib.sha256(content.encode("utf-8")).hexdigest()
+    
     def get_stats(self) -> Dict[str, Any]:
         """Get graph statistics"""
+        # One pass over the nodes instead of a scan per statistic
+        type_counts: Dict[NodeType, int] = {}
+        critical_nodes = 0
+        for n in self.nodes.values():
+            type_counts[n.type] = type_counts.get(n.type, 0) + 1
+            if n.criticality >= 0.7:
+                critical_nodes += 1
+        
         return {
             "total_nodes": len(self.nodes),
             "total_edges": len(self.edges),
-            "decisions": len(self.get_decision_nodes()),
-            "behaviors": len(self.get_behavior_nodes()),
-            "assumptions": len(self.get_nodes_by_type(NodeType.ASSUMPTION)),
-            "constraints": len(self.get_nodes_by_type(NodeType.CONSTRAINT)),
-            "critical_nodes": len(self.get_critical_nodes()),
+            "decisions": type_counts.get(NodeType.DECISION, 0),
+            "behaviors": type_counts.get(NodeType.BEHAVIOR, 0),
+            "assumptions": type_counts.get(NodeType.ASSUMPTION, 0),
+            "constraints": type_counts.get(NodeType.CONSTRAINT, 0),
+            "critical_nodes": critical_nodes,
         }
@@ -2,8 +2,16 @@
 Analysis Result - Single Source of Truth
 Data contract for all analysis outputs
 """
+import json
+import sys
+from collections import Counter
 from typing import List, Dict, Optional
-from datetime import datetime
+from datetime import datetime, timezone
+
+try:
+    import orjson  # Optional accelerator: C serializer for large findings lists
+except ImportError:
+    orjson = None
 
 
 class AnalysisResult:
@@ -20,12 +28,29 @@ class AnalysisResult:
         self.confidence: float = 1.0
         self.findings: List[Dict] = []
         self.engine_version: str = "1.0.0"
-        self.timestamp: str = datetime.utcnow().isoformat()
+        self.timestamp: str = datetime.now(timezone.utc).isoformat()
         self.metadata: Dict = {}
+        self._severity_counts: Counter = Counter()
     
     def add_finding(self, finding: Dict) -> None:
         """Add a finding to the results"""
         self.findings.append(finding)
+        severity = finding.get("severity")
+        if type(severity) is str:
+            # Severities parsed from input are fresh strings; interning them
+            # lets tally lookups against the literal names match by identity
+            severity = sys.intern(severity)
+        self._severity_counts[severity] += 1
+    
+    def severity_counts(self) -> Counter:
+        """
+        Number of findings per severity.
+        Tallied as findings are added; recounted if the findings list
+        was modified directly.
+        """
+        if sum(self._severity_counts.values()) != len(self.findings):
+            self._severity_counts = Counter(f.get("severity") for f in self.findings)
+        return self._severity_counts
     
     def to_dict(self) -> Dict:
         """Export result as dictionary for JSON serialization"""
@@ -41,5 +66,20 @@ class AnalysisResult:
             "metadata": self.metadata
         }
     
+    def to_json(self) -> bytes:
+        """
+        Serialize the result as UTF-8 JSON.
+        Uses orjson when installed; values it cannot encode fall back to str().
+        Payloads orjson rejects (e.g. integers wider than 64 bits) are
+        encoded with stdlib json instead.
+        """
+        data = self.to_dict()
+        if orjson is not None:
+            try:
+                return orjson.dumps(data, default=str, option=orjson.OPT_NON_STR_KEYS)
+            except orjson.JSONEncodeError:
+                pass
+        return json.dumps(data, ensure_ascii=False, default=str).encode("utf-8")
+    
     def __repr__(self) -> str:
         return f"<AnalysisResult {self.verdict} score={self.score} findings={len(self.findings)}>"
@@ -13,7 +13,7 @@ Only binary existence.
 """
 
 from dataclasses import dataclass
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 from enum import Enum
 
 
@@ -27,6 +27,10 @@ class VerdictType(Enum):
 @dataclass
 class ExistenceVerdict:
     """Final verdict on system existence"""
+    __slots__ = ("verdict", "certainty", "primary_reason", "supporting_evidence",
+                 "failure_inevitability_index", "axiom_violations",
+                 "counterfactual_failures", "proof_chain")
+    
     verdict: VerdictType
     certainty: float  # How certain are we (for UNVERIFIED cases)
     primary_reason: str
@@ -75,6 +79,11 @@ class ExistenceJudge:
         self.violations = axiom_violations
         self.fii = fii
         self.cf_results = counterfactual_results
+        
+        # Counterfactual failures, counted by every verdict
+        self._cf_failures = [r for r in counterfactual_results if not r.survived]
+        # Graph statistics, gathered on first use
+        self._stats: Optional[Dict[str, Any]] = None
     
     def render_verdict(self) -> ExistenceVerdict:
         """
@@ -82,20 +91,20 @@ class ExistenceJudge:
         This is a deterministic decision based on logical analysis.
         """
         
-        # Check for fatal axiom violations
-        fatal_violations = [v for v in self.violations if v.is_fatal()]
+        # Check for fatal axiom violations (only the first one is reported)
+        fatal_violation = next((v for v in self.violations if v.is_fatal()), None)
         
-        if fatal_violations:
-            return self._verdict_fatal_axiom(fatal_violations[0])
+        if fatal_violation is not None:
+            return self._verdict_fatal_axiom(fatal_violation)
         
         # Check FII threshold
         if self.fii >= 0.90:
             return self._verdict_inevitable_failure()
         
-        # Check critical counterfactual failures
+        # Check critical counterfactual failures; only reached when the
+        # cheaper checks above did not decide the verdict
         critical_cf_failures = [
-            r for r in self.cf_results
-            if not r.survived and r.scenario.criticality >= 0.7
+            r for r in self._cf_failures if r.scenario.criticality >= 0.7
         ]
         
         if len(critical_cf_failures) >= 2:  # Multiple critical failures
@@ -115,7 +124,7 @@ class ExistenceJudge:
     
     def _verdict_fatal_axiom(self, violation) -> ExistenceVerdict:
         """Verdict: Fatal axiom violation"""
-        return ExistenceVerdict(
+        return self._verdict(
             verdict=VerdictType.NOT_PERMISSIBLE,
             certainty=1.0,
             primary_reason=f"Fatal violation of {violation.axiom_name}",
@@ -124,9 +133,6 @@ class ExistenceJudge:
                 f"Severity: {violation.severity:.2%}",
                 f"Violation type: {violation.violation_type.value}"
             ],
-            failure_inevitability_index=self.fii,
-            axiom_violations=self.violations,
-            counterfactual_failures=self._count_cf_failures(),
             proof_chain=[
                 "AXIOM_VERIFICATION",
                 violation.axiom_name,
@@ -139,7 +145,7 @@ class ExistenceJudge:
     
     def _verdict_inevitable_failure(self) -> ExistenceVerdict:
         """Verdict: Failure is inevitable"""
-        return ExistenceVerdict(
+        return self._verdict(
             verdict=VerdictType.NOT_PERMISSIBLE,
             certainty=1.0,
             primary_reason=f"Failure Inevitability Index: {self.fii:.2%}",
@@ -148,9 +154,6 @@ class ExistenceJudge:
                 f"FII threshold exceeded: {self.fii:.2%} ≥ 90%",
                 "Per Inevitability Axiom: system is logically failed"
             ],
-            failure_inevitability_index=self.fii,
-            axiom_violations=self.violations,
-            counterfactual_failures=self._count_cf_failures(),
             proof_chain=[
                 "FII_CALCULATION",
                 f"fii={self.fii:.4f}",
@@ -163,7 +166,7 @@ class ExistenceJudge:
     
     def _verdict_counterfactual_failure(self, failures: List) -> ExistenceVerdict:
         """Verdict: Failed critical counterfactuals"""
-        return ExistenceVerdict(
+        return self._verdict(
             verdict=VerdictType.NOT_PERMISSIBLE,
             certainty=0.95,
             primary_reason=f"System collapsed in {len(failures)} critical scenarios",
@@ -172,8 +175,6 @@ class ExistenceJudge:
             ] + [
                 "Per Counterfactual Validity Axiom: system is fundamentally fragile"
             ],
-            failure_inevitability_index=self.fii,
-            axiom_violations=self.violations,
             counterfactual_failures=len(failures),
             proof_chain=[
                 "COUNTERFACTUAL_SIMULATION",
@@ -189,7 +190,7 @@ class ExistenceJudge:
         """Verdict: Insufficient data"""
         missing = self._identify_missing_data()
         
-        return ExistenceVerdict(
+        return self._verdict(
             verdict=VerdictType.UNVERIFIED,
             certainty=0.5,
             primary_reason="Insufficient data to render verdict",
@@ -198,9 +199,6 @@ class ExistenceJudge:
                 "Cannot verify system without complete model",
                 "Recommendation: Provide additional system specifications"
             ],
-            failure_inevitability_index=self.fii,
-            axiom_violations=self.violations,
-            counterfactual_failures=self._count_cf_failures(),
             proof_chain=[
                 "DATA_COMPLETENESS_CHECK",
                 "INCOMPLETE_MODEL",
@@ -212,7 +210,7 @@ class ExistenceJudge:
     
     def _verdict_permissible_fragile(self) -> ExistenceVerdict:
         """Verdict: Permissible but fragile"""
-        return ExistenceVerdict(
+        return self._verdict(
             verdict=VerdictType.PERMISSIBLE,
             certainty=0.75,
             primary_reason="System is logically permissible but exhibits fragility",
@@ -221,9 +219,6 @@ class ExistenceJudge:
                 f"Axiom violations: {len(self.violations)} (non-fatal)",
                 "System may survive but requires careful operation"
             ],
-            failure_inevitability_index=self.fii,
-            axiom_violations=self.violations,
-            counterfactual_failures=self._count_cf_failures(),
             proof_chain=[
                 "AXIOM_VERIFICATION",
                 "no_fatal_violations",
@@ -238,7 +233,7 @@ class ExistenceJudge:
     
     def _verdict_permissible_robust(self) -> ExistenceVerdict:
         """Verdict: Permissible and robust"""
-        return ExistenceVerdict(
+        return self._verdict(
             verdict=VerdictType.PERMISSIBLE,
             certainty=1.0,
             primary_reason="System is logically permissible and robust",
@@ -248,9 +243,6 @@ class ExistenceJudge:
                 "Survived critical counterfactual scenarios",
                 "System demonstrates structural soundness"
             ],
-            failure_inevitability_index=self.fii,
-            axiom_violations=self.violations,
-            counterfactual_failures=self._count_cf_failures(),
             proof_chain=[
                 "AXIOM_VERIFICATION",
                 "no_fatal_violations",
@@ -263,9 +255,15 @@ class ExistenceJudge:
             ]
         )
     
+    def _get_stats(self) -> Dict[str, Any]:
+        """Graph statistics, shared by the data-completeness checks"""
+        if self._stats is None:
+            self._stats = self.graph.get_stats()
+        return self._stats
+    
     def _has_sufficient_data(self) -> bool:
         """Check if we have sufficient data to render verdict"""
-        stats = self.graph.get_stats()
+        stats = self._get_stats()
         
         # Must have at least:
         # - Some decisions
@@ -278,18 +276,15 @@ class ExistenceJudge:
         if stats["total_edges"] == 0:
             return False
         
-        # Check for orphaned behaviors (no decision ancestry)
-        behaviors = self.graph.get_behavior_nodes()
-        for behavior in behaviors:
-            if not self.graph.has_decision_ancestry(behavior):
-                return False  # Incomplete model
-        
-        return True
+        # Check for orphaned behaviors (no decision ancestry); any orphan
+        # means an incomplete model
+        has_decision_ancestry = self.graph.has_decision_ancestry
+        return all(has_decision_ancestry(b) for b in self.graph.get_behavior_nodes())
     
     def _identify_missing_data(self) -> List[str]:
         """Identify what data is missing"""
         missing = []
-        stats = self.graph.get_stats()
+        stats = self._get_stats()
         
         if stats["decisions"] == 0:
             missing.append("engineering decisions")
@@ -305,9 +300,18 @@ class ExistenceJudge:
         
         return missing
     
-    def _count_cf_failures(self) -> int:
-        """Count counterfactual failures"""
-        return sum(1 for r in self.cf_results if not r.survived)
+    def _verdict(self, **fields) -> ExistenceVerdict:
+        """ExistenceVerdict with the metrics shared by every verdict filled in"""
+        fields.setdefault("counterfactual_failures", len(self._cf_failures))
+        return ExistenceVerdict(
+            failure_inevitability_index=self.fii,
+            axiom_violations=self.violations,
+            **fields
+        )
+
+
+# Horizontal rule framing the formatted verdict
+_RULE = "═" * 70
 
 
 class VerdictFormatter:
@@ -316,47 +320,36 @@ class VerdictFormatter:
     @staticmethod
     def format(verdict: ExistenceVerdict) -> str:
         """Format verdict as dark, authoritative terminal output"""
-        lines = []
-        
         # Header
-        lines.append("")
-        lines.append("═" * 70)
-        lines.append("SINGULARITY-Δ EXISTENCE VERIFICATION")
-        lines.append("═" * 70)
-        lines.append("")
+        lines = ["", _RULE, "SINGULARITY-Δ EXISTENCE VERIFICATION", _RULE, ""]
         
         # Verdict
-        lines.append("SYSTEM EXISTENCE VERDICT:")
-        lines.append(f"  {verdict.verdict.value}")
-        lines.append("")
+        lines.extend(["SYSTEM EXISTENCE VERDICT:", f"  {verdict.verdict.value}", ""])
         
         # Primary reason
-        lines.append("PRIMARY REASON:")
-        lines.append(f"  {verdict.primary_reason}")
-        lines.append("")
+        lines.extend(["PRIMARY REASON:", f"  {verdict.primary_reason}", ""])
         
         # Supporting evidence
         if verdict.supporting_evidence:
             lines.append("SUPPORTING EVIDENCE:")
-            for evidence in verdict.supporting_evidence:
-                lines.append(f"  • {evidence}")
+            lines.extend([f"  • {evidence}" for evidence in verdict.supporting_evidence])
             lines.append("")
         
         # Metrics
-        lines.append("METRICS:")
-        lines.append(f"  Failure Inevitability Index: {verdict.failure_inevitability_index:.2%}")
-        lines.append(f"  Axiom Violations: {len(verdict.axiom_violations)}")
-        lines.append(f"  Counterfactual Failures: {verdict.counterfactual_failures}")
-        lines.append(f"  Verdict Certainty: {verdict.certainty:.1%}")
-        lines.append("")
+        lines.extend([
+            "METRICS:",
+            f"  Failure Inevitability Index: {verdict.failure_inevitability_index:.2%}",
+            f"  Axiom Violations: {len(verdict.axiom_violations)}",
+            f"  Counterfactual Failures: {verdict.counterfactual_failures}",
+            f"  Verdict Certainty: {verdict.certainty:.1%}",
+            ""
+        ])
         
         # Proof chain
         lines.append("PROOF CHAIN:")
-        for i, step in enumerate(verdict.proof_chain, 1):
-            lines.append(f"  {i}. {step}")
+        lines.extend([f"  {i}. {step}" for i, step in enumerate(verdict.proof_chain, 1)])
         lines.append("")
         
-        lines.append("═" * 70)
-        lines.append("")
+        lines.extend([_RULE, ""])
         
         return "\n".join(lines)
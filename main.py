@@ -9,15 +9,35 @@ CREATED BY VISHAL THAKUR
 import sys
 import os
 import json
+import time
+from collections import Counter
 from pathlib import Path
 from datetime import datetime
 
+# Resolved once at import: main() chdirs here, after which a relative
+# __file__ would no longer point at the project
+_ROOT = Path(__file__).resolve().parent
+_DATASETS = _ROOT / "datasets"
+_LOGS = _ROOT / "logs"
+
 # ==============================
 # Utility
 # ==============================
 
+# Cosmetic pauses between analysis steps; opt in with SD_THEATRICAL=1
+THEATRICAL = os.environ.get("SD_THEATRICAL") == "1"
+
+def pause(seconds):
+    if THEATRICAL:
+        time.sleep(seconds)
+
 def clear_screen():
-    os.system('clear' if os.name != 'nt' else 'cls')
+    # ANSI "erase display + cursor home" on a terminal; no shell per redraw
+    if sys.stdout.isatty():
+        sys.stdout.write("\x1b[2J\x1b[H")
+        sys.stdout.flush()
+    else:
+        os.system('clear' if os.name != 'nt' else 'cls')
 
 def safe_input(prompt):
     try:
@@ -69,10 +89,9 @@ def get_choice():
 # ==============================
 
 def find_json_files():
-    datasets_dir = Path(__file__).parent / "datasets"
-    if not datasets_dir.exists():
+    if not _DATASETS.exists():
         return []
-    return list(datasets_dir.glob("*.json"))
+    return sorted(_DATASETS.glob("*.json"))
 
 def select_file():
     files = find_json_files()
@@ -113,12 +132,18 @@ from services.validator import Validator
 from output.json_exporter import JSONExporter
 from output.html_report import HTMLReport
 
+_SEVERITY_EMOJIS = {
+    'CRITICAL': '🔴',
+    'HIGH': '🟠',
+    'MEDIUM': '🟡',
+    'LOW': '🔵',
+    'INFO': '⚪'
+}
+
 def analyze_system():
     """
     Main analysis function - now uses the real engine.
     """
-    import time
-    
     print("\n" + "="*60)
     print("🔍 SYSTEM ANALYSIS INITIATED")
     print("="*60 + "\n")
@@ -129,7 +154,7 @@ def analyze_system():
         return
 
     print("\n🔄 LOADING DATA...")
-    time.sleep(0.5)
+    pause(0.5)
     
     # Load data using the proper service
     try:
@@ -145,45 +170,46 @@ def analyze_system():
         return
 
     print("🔍 PERFORMING PRE-VALIDATION...")
-    time.sleep(0.3)
+    pause(0.3)
     
     # Quick validation
     valid, msg = Validator.quick_validate(data)
     if not valid:
         print(f"⚠️  VALIDATION WARNING: {msg.upper()}")
         print("⚙️  PROCEEDING WITH ENGINE ANALYSIS...")
-        time.sleep(0.3)
+        pause(0.3)
     else:
         print(f"✅ PRE-VALIDATION: {msg.upper()}")
 
     # Get target name
     target = DataLoader.get_target_name(data)
+    target_upper = target.upper()  # Reused in the results block
     
-    print(f"\n🎯 TARGET IDENTIFIED: {target.upper()}")
-    time.sleep(0.3)
+    print(f"\n🎯 TARGET IDENTIFIED: {target_upper}")
+    pause(0.3)
     
     # Initialize engine with all rules
     print(f"⚙️  INITIALIZING ENGINE WITH {len(DEFAULT_RULES)} RULES...")
-    time.sleep(0.5)
-    engine = Engine(DEFAULT_RULES)
+    pause(0.5)
+    engine = Engine(DEFAULT_RULES, verbose=True, pace=THEATRICAL)
     print("✅ ENGINE READY")
     
     # Run the engine (this is where the real magic happens)
     print("\n" + "="*60)
     print("🚀 EXECUTING ANALYSIS ENGINE")
     print("="*60)
-    time.sleep(0.3)
+    pause(0.3)
     
     print("\n📋 EXECUTING COMPLETENESS RULES...")
-    time.sleep(0.4)
+    pause(0.4)
     print("📋 EXECUTING CONSISTENCY RULES...")
-    time.sleep(0.4)
+    pause(0.4)
     print("📋 EXECUTING STRUCTURE RULES...")
-    time.sleep(0.4)
+    pause(0.4)
     print("🧮 CALCULATING SCORES...")
-    time.sleep(0.3)
+    pause(0.3)
     print("🎯 DETERMINING VERDICT...")
-    time.sleep(0.3)
+    pause(0.3)
     
     result = engine.run(data, target)
     
@@ -192,50 +218,45 @@ def analyze_system():
     # Get file metadata
     size = json_file.stat().st_size
     
-    # Display results
-    print("\n" + "="*60)
-    print("📊 ANALYSIS RESULTS")
-    print("="*60)
-    print(f"\n📄 FILE       : {json_file.name.upper()}")
-    print(f"💾 SIZE       : {size} BYTES")
-    print(f"🎯 TARGET     : {result.target.upper()}")
-    print(f"📈 SCORE      : {result.score:.1f}/100")
-    print(f"⚠️  RISK       : {result.risk}")
-    print(f"🔍 FINDINGS   : {len(result.findings)}")
-    print(f"\n{'='*60}")
-    
-    # Verdict with emoji
+    # Display results (collected and written in one call)
     verdict_emoji = "✅" if result.verdict == "PASSED" else "❌" if result.verdict == "FAILED" else "⚠️"
-    print(f"{verdict_emoji} VERDICT    : {result.verdict}")
-    print(f"📊 CONFIDENCE : {result.confidence:.2%}")
-    print("="*60)
+    out = [
+        "\n" + "="*60,
+        "📊 ANALYSIS RESULTS",
+        "="*60,
+        f"\n📄 FILE       : {json_file.name.upper()}",
+        f"💾 SIZE       : {size} BYTES",
+        f"🎯 TARGET     : {target_upper}",
+        f"📈 SCORE      : {result.score:.1f}/100",
+        f"⚠️  RISK       : {result.risk}",
+        f"🔍 FINDINGS   : {len(result.findings)}",
+        f"\n{'='*60}",
+        f"{verdict_emoji} VERDICT    : {result.verdict}",
+        f"📊 CONFIDENCE : {result.confidence:.2%}",
+        "="*60,
+    ]
     
     # Show findings summary
     if result.findings:
-        print(f"\n⚠️  FINDINGS DETECTED:")
-        severity_counts = {}
-        severity_emojis = {
-            'CRITICAL': '🔴',
-            'HIGH': '🟠',
-            'MEDIUM': '🟡',
-            'LOW': '🔵',
-            'INFO': '⚪'
-        }
-        for finding in result.findings:
-            severity = finding.get('severity', 'UNKNOWN')
-            severity_counts[severity] = severity_counts.get(severity, 0) + 1
+        out.append(f"\n⚠️  FINDINGS DETECTED:")
+        # The result tallies severities as findings are added
+        severity_counts = Counter()
+        for severity, count in result.severity_counts().items():
+            severity_counts['UNKNOWN' if severity is None else severity] += count
         
         for severity, count in sorted(severity_counts.items(), reverse=True):
-            emoji = severity_emojis.get(severity, '⚫')
-            print(f"  {emoji} {severity:12} : {count}")
+            emoji = _SEVERITY_EMOJIS.get(severity, '⚫')
+            out.append(f"  {emoji} {severity:12} : {count}")
     else:
-        print(f"\n✅ NO FINDINGS - SYSTEM IS CLEAN")
+        out.append(f"\n✅ NO FINDINGS - SYSTEM IS CLEAN")
+    
+    sys.stdout.write("\n".join(out) + "\n")
     
     # Store source path for exporters
     result.source_path = str(json_file)
     
     # Export using proper services
-    logs_dir = Path(__file__).parent / "logs"
+    logs_dir = _LOGS
     logs_dir.mkdir(exist_ok=True)
     
     json_path = logs_dir / "result.json"
@@ -246,12 +267,12 @@ def analyze_system():
     print("="*60)
     
     print("\n📝 GENERATING JSON REPORT...")
-    time.sleep(0.3)
+    pause(0.3)
     JSONExporter.export(result, str(json_path))
     print(f"✅ JSON EXPORTED → {json_path}")
     
     print("\n🌐 GENERATING HTML REPORT...")
-    time.sleep(0.5)
+    pause(0.5)
     HTMLReport.generate(result, str(html_path))
     print(f"✅ HTML EXPORTED → {html_path}")
     
@@ -266,7 +287,9 @@ def analyze_system():
 # ==============================
 
 def main():
-    os.chdir(Path(__file__).parent)
+    os.chdir(_ROOT)
+    if os.name == 'nt':
+        os.system('')  # Turns on VT escape processing in the Windows console
     while True:
         clear_screen()
         show_banner()
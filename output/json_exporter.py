@@ -3,15 +3,87 @@ JSON Exporter
 Enterprise-grade export layer for Singularity-Delta
 """
 
+import os
 import json
 import uuid
 import hashlib
+import threading
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, Any
+from typing import Optional, Any, Set, BinaryIO
 from datetime import datetime
 
 from core.result import AnalysisResult
 
+try:
+    import orjson  # Optional accelerator: C serializer, writes UTF-8 bytes directly
+except ImportError:
+    orjson = None
+
+
+# Source files are hashed in fixed-size chunks rather than read whole
+_HASH_CHUNK_SIZE = 1 << 20
+
+# Parent directories already created by _write; set.add is atomic, and a
+# racing mkdir(exist_ok=True) is harmless
+_CREATED_DIRS: Set[str] = set()
+
+
+class _UUIDPool:
+    """
+    Random (version 4) UUID strings cut from one os.urandom read per batch
+    instead of one read per UUID. The buffer is dropped in forked children
+    so parent and child never hand out the same bytes.
+    """
+
+    def __init__(self, size: int = 256):
+        self._size = size
+        self._reset()
+        if hasattr(os, "register_at_fork"):
+            os.register_at_fork(after_in_child=self._reset)
+
+    def _reset(self) -> None:
+        self._lock = threading.Lock()
+        self._buf = b""
+        self._pos = 0
+
+    def next(self) -> str:
+        with self._lock:
+            if self._pos >= len(self._buf):
+                self._buf = os.urandom(16 * self._size)
+                self._pos = 0
+            raw = self._buf[self._pos:self._pos + 16]
+            self._pos += 16
+        # version=4 sets the RFC 4122 version and variant bits
+        return str(uuid.UUID(bytes=raw, version=4))
+
+
+_RUN_IDS = _UUIDPool()
+
+
+def _ensure_dir(directory: Path, force: bool = False) -> None:
+    """Create directory (and parents) unless this process already did"""
+    key = str(directory)
+    if force or key not in _CREATED_DIRS:
+        directory.mkdir(parents=True, exist_ok=True)
+        _CREATED_DIRS.add(key)
+
+
+@lru_cache(maxsize=128)
+def _sha256_file(path: str, mtime_ns: int, size: int) -> str:
+    """
+    SHA-256 hex digest of a file, streamed from disk.
+    Cached per file version: mtime_ns and size are part of the key only,
+    so a modified file is hashed again.
+    """
+    with open(path, "rb") as f:
+        if hasattr(hashlib, "file_digest"):  # Python 3.11+: chunked loop in C
+            return hashlib.file_digest(f, "sha256").hexdigest()
+        digest = hashlib.sha256()
+        for chunk in iter(lambda: f.read(_HASH_CHUNK_SIZE), b""):
+            digest.update(chunk)
+        return digest.hexdigest()
+
 
 class JSONExporter:
     """
@@ -49,6 +121,43 @@ class JSONExporter:
                 pass
         return str(obj)
 
+    @staticmethod
+    def _default(obj: Any) -> Any:
+        """
+        orjson fallback for values it cannot encode natively,
+        converted the same way _safe converts them.
+        """
+        if hasattr(obj, "isoformat"):
+            try:
+                return obj.isoformat()
+            except Exception:
+                pass
+        return str(obj)
+
+    @staticmethod
+    def _dump_bytes(payload: Any, pretty: bool) -> bytes:
+        """
+        Serialize any payload to UTF-8 bytes.
+        orjson encodes the payload as-is, calling _default for values it
+        does not support; without orjson (or for values it rejects, such as
+        integers wider than 64 bits) the payload is copied through _safe
+        and encoded with stdlib json.
+        """
+        if orjson is not None:
+            # Dataclasses and datetimes go through _default, as in _safe
+            option = (orjson.OPT_NON_STR_KEYS
+                      | orjson.OPT_PASSTHROUGH_DATACLASS
+                      | orjson.OPT_PASSTHROUGH_DATETIME)
+            if pretty:
+                option |= orjson.OPT_INDENT_2
+            try:
+                return orjson.dumps(payload, default=JSONExporter._default, option=option)
+            except orjson.JSONEncodeError:
+                pass
+        return json.dumps(
+            JSONExporter._safe(payload), indent=2 if pretty else None, ensure_ascii=False
+        ).encode("utf-8")
+
     # -----------------------------
     # INPUT METADATA (HASHING)
     # -----------------------------
@@ -66,51 +175,76 @@ class JSONExporter:
             if not p.exists():
                 return None
 
-            sha256 = hashlib.sha256(p.read_bytes()).hexdigest()
+            path = str(p.resolve())
+            st = p.stat()
 
             return {
-                "path": str(p.resolve()),
+                "path": path,
                 "filename": p.name,
-                "size_bytes": p.stat().st_size,
-                "sha256": sha256,
+                "size_bytes": st.st_size,
+                "sha256": _sha256_file(path, st.st_mtime_ns, st.st_size),
             }
         except Exception:
             return None
 
     # -----------------------------
-    # CORE EXPORT
+    # SHARED PAYLOAD / WRITER
     # -----------------------------
     @staticmethod
-    def export(
-        result: AnalysisResult,
-        filepath: str,
-        pretty: bool = True
-    ) -> None:
+    def _full_payload(result: AnalysisResult) -> dict:
         """
-        Export full analysis result to JSON file.
+        Full export document: engine run info, input metadata, result.
         """
-
-        raw = result.to_dict()
-
-        payload = {
+        return {
             "engine": {
                 "name": JSONExporter.ENGINE_NAME,
                 "version": JSONExporter.ENGINE_VERSION,
-                "run_id": str(uuid.uuid4()),
-                "timestamp": JSONExporter._safe(result.timestamp),
+                "run_id": _RUN_IDS.next(),
+                "timestamp": result.timestamp,
             },
             "input": JSONExporter._input_metadata(result),
-            "result": JSONExporter._safe(raw),
+            "result": result.to_dict(),
         }
 
+    @staticmethod
+    def _open_binary(filepath: str) -> BinaryIO:
+        """
+        Open filepath for binary writing, creating parent directories.
+        """
         path = Path(filepath)
-        path.parent.mkdir(parents=True, exist_ok=True)
+        _ensure_dir(path.parent)
 
-        with open(path, "w", encoding="utf-8") as f:
-            if pretty:
-                json.dump(payload, f, indent=2, ensure_ascii=False)
-            else:
-                json.dump(payload, f, ensure_ascii=False)
+        try:
+            return open(path, "wb")
+        except FileNotFoundError:
+            # Directory removed since it was first created
+            _ensure_dir(path.parent, force=True)
+            return open(path, "wb")
+
+    @staticmethod
+    def _write(filepath: str, payload: Any, pretty: bool) -> None:
+        """
+        Serialize payload to filepath, creating parent directories
+        (once per directory per process).
+        """
+        data = JSONExporter._dump_bytes(payload, pretty)
+        with JSONExporter._open_binary(filepath) as f:
+            f.write(data)
+
+    # -----------------------------
+    # CORE EXPORT
+    # -----------------------------
+    @staticmethod
+    def export(
+        result: AnalysisResult,
+        filepath: str,
+        pretty: bool = True
+    ) -> None:
+        """
+        Export full analysis result to JSON file.
+        """
+
+        JSONExporter._write(filepath, JSONExporter._full_payload(result), pretty)
 
     # -----------------------------
     # STRING EXPORT
@@ -124,22 +258,8 @@ class JSONExporter:
         Export result to JSON string.
         """
 
-        raw = result.to_dict()
-
-        payload = {
-            "engine": {
-                "name": JSONExporter.ENGINE_NAME,
-                "version": JSONExporter.ENGINE_VERSION,
-                "run_id": str(uuid.uuid4()),
-                "timestamp": JSONExporter._safe(result.timestamp),
-            },
-            "input": JSONExporter._input_metadata(result),
-            "result": JSONExporter._safe(raw),
-        }
-
-        if pretty:
-            return json.dumps(payload, indent=2, ensure_ascii=False)
-        return json.dumps(payload, ensure_ascii=False)
+        payload = JSONExporter._full_payload(result)
+        return JSONExporter._dump_bytes(payload, pretty).decode("utf-8")
 
     # -----------------------------
     # SUMMARY EXPORT (MANAGEMENT)
@@ -157,7 +277,7 @@ class JSONExporter:
             "engine": {
                 "name": JSONExporter.ENGINE_NAME,
                 "version": JSONExporter.ENGINE_VERSION,
-                "timestamp": JSONExporter._safe(result.timestamp),
+                "timestamp": result.timestamp,
             },
             "target": result.target,
             "verdict": result.verdict,
@@ -166,16 +286,7 @@ class JSONExporter:
             "total_findings": len(result.findings),
         }
 
-        path = Path(filepath)
-        path.parent.mkdir(parents=True, exist_ok=True)
-
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(
-                JSONExporter._safe(summary),
-                f,
-                indent=2,
-                ensure_ascii=False
-            )
+        JSONExporter._write(filepath, summary, pretty=True)
 
     # -----------------------------
     # FINDINGS-ONLY EXPORT (CI/CD)
@@ -197,11 +308,42 @@ class JSONExporter:
             "target": result.target,
             "verdict": result.verdict,
             "risk": result.risk,
-            "findings": JSONExporter._safe(result.findings),
+            "findings": result.findings,
         }
 
-        path = Path(filepath)
-        path.parent.mkdir(parents=True, exist_ok=True)
+        JSONExporter._write(filepath, data, pretty=True)
+
+    # -----------------------------
+    # FINDINGS STREAM EXPORT (NDJSON)
+    # -----------------------------
+    @staticmethod
+    def export_findings_ndjson(
+        result: AnalysisResult,
+        filepath: str
+    ) -> None:
+        """
+        Export findings as newline-delimited JSON, one object per line.
+
+        The first line is a header object (engine, target, verdict, risk);
+        every following line is one finding. Findings are encoded and
+        written one at a time, so the full document is never held in
+        memory, and each line can be parsed on its own (jq, log ingestors).
+        """
+
+        header = {
+            "engine": {
+                "name": JSONExporter.ENGINE_NAME,
+                "version": JSONExporter.ENGINE_VERSION,
+            },
+            "target": result.target,
+            "verdict": result.verdict,
+            "risk": result.risk,
+        }
 
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
\ No newline at end of file
+        dump = JSONExporter._dump_bytes
+        with JSONExporter._open_binary(filepath) as f:
+            f.write(dump(header, False))
+            f.write(b"\n")
+            for finding in result.findings:
+                f.write(dump(finding, False))
+                f.write(b"\n")
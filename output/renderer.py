@@ -3,6 +3,8 @@ CLI Renderer
 Beautiful terminal output formatting
 NO LOGIC. ONLY DISPLAY.
 """
+import sys
+from collections import defaultdict
 from typing import Dict, List
 from core.result import AnalysisResult
 
@@ -26,6 +28,9 @@ class CLIRenderer:
         "GRAY": "\033[90m"
     }
     
+    # Same keys, no escape sequences - used when colors are disabled
+    PLAIN_COLORS = {k: "" for k in COLORS}
+    
     SEVERITY_COLORS = {
         "CRITICAL": "RED",
         "HIGH": "RED",
@@ -34,6 +39,16 @@ class CLIRenderer:
         "INFO": "GRAY"
     }
     
+    SEVERITY_ORDER = ("CRITICAL", "HIGH", "MEDIUM", "LOW", "INFO")
+    
+    RISK_COLORS = {
+        "NONE": "GREEN",
+        "LOW": "BLUE",
+        "MEDIUM": "YELLOW",
+        "HIGH": "RED",
+        "CRITICAL": "RED"
+    }
+    
     @classmethod
     def render(cls, result: AnalysisResult, use_colors: bool = True) -> None:
         """
@@ -43,137 +58,127 @@ class CLIRenderer:
             result: AnalysisResult to render
             use_colors: Whether to use terminal colors
         """
-        if not use_colors:
-            cls.COLORS = {k: "" for k in cls.COLORS}
+        colors = cls.COLORS if use_colors else cls.PLAIN_COLORS
+        
+        # Sections append their lines here; the report is written in one call
+        out: List[str] = []
+        cls._render_header(out, colors)
+        cls._render_summary(out, result, colors)
+        cls._render_findings(out, result, colors)
+        cls._render_footer(out, result, colors)
         
-        cls._render_header()
-        cls._render_summary(result)
-        cls._render_findings(result)
-        cls._render_footer(result)
+        sys.stdout.write("\n".join(out) + "\n")
+        sys.stdout.flush()
     
     @classmethod
-    def _render_header(cls) -> None:
+    def _render_header(cls, out: List[str], colors: Dict[str, str]) -> None:
         """Render analysis header"""
-        bold = cls.COLORS["BOLD"]
-        cyan = cls.COLORS["CYAN"]
-        reset = cls.COLORS["RESET"]
+        bold = colors["BOLD"]
+        cyan = colors["CYAN"]
+        reset = colors["RESET"]
         
-        print(f"\n{bold}{cyan}╔════════════════════════════════════════════════════════════════╗{reset}")
-        print(f"{bold}{cyan}║           SINGULARITY DELTA - ANALYSIS REPORT                  ║{reset}")
-        print(f"{bold}{cyan}╚════════════════════════════════════════════════════════════════╝{reset}\n")
+        out.append(f"\n{bold}{cyan}╔════════════════════════════════════════════════════════════════╗{reset}")
+        out.append(f"{bold}{cyan}║           SINGULARITY DELTA - ANALYSIS REPORT                  ║{reset}")
+        out.append(f"{bold}{cyan}╚════════════════════════════════════════════════════════════════╝{reset}\n")
     
     @classmethod
-    def _render_summary(cls, result: AnalysisResult) -> None:
+    def _render_summary(cls, out: List[str], result: AnalysisResult, colors: Dict[str, str]) -> None:
         """Render summary section"""
-        bold = cls.COLORS["BOLD"]
-        reset = cls.COLORS["RESET"]
+        bold = colors["BOLD"]
+        reset = colors["RESET"]
         
         # Verdict color
-        verdict_color = cls.COLORS["GREEN"] if result.verdict == "PASSED" else cls.COLORS["RED"]
+        verdict_color = colors["GREEN"] if result.verdict == "PASSED" else colors["RED"]
         
         # Risk color
-        risk_colors = {
-            "NONE": "GREEN",
-            "LOW": "BLUE",
-            "MEDIUM": "YELLOW",
-            "HIGH": "RED",
-            "CRITICAL": "RED"
-        }
-        risk_color = cls.COLORS[risk_colors.get(result.risk, "GRAY")]
-        
-        print(f"{bold}FINAL VERDICT{reset}")
-        print("=" * 64)
-        print(f"Target        : {result.target}")
-        print(f"Verdict       : {verdict_color}{bold}{result.verdict}{reset}")
-        print(f"Risk Level    : {risk_color}{bold}{result.risk}{reset}")
-        print(f"Score         : {result.score:.1f}/100.0")
-        print(f"Confidence    : {result.confidence:.2f}")
-        print(f"Findings      : {len(result.findings)}")
-        print(f"Engine Version: {result.engine_version}")
-        print(f"Timestamp     : {result.timestamp}")
-        print()
+        risk_color = colors[cls.RISK_COLORS.get(result.risk, "GRAY")]
+        
+        out.append(f"{bold}FINAL VERDICT{reset}")
+        out.append("=" * 64)
+        out.append(f"Target        : {result.target}")
+        out.append(f"Verdict       : {verdict_color}{bold}{result.verdict}{reset}")
+        out.append(f"Risk Level    : {risk_color}{bold}{result.risk}{reset}")
+        out.append(f"Score         : {result.score:.1f}/100.0")
+        out.append(f"Confidence    : {result.confidence:.2f}")
+        out.append(f"Findings      : {len(result.findings)}")
+        out.append(f"Engine Version: {result.engine_version}")
+        out.append(f"Timestamp     : {result.timestamp}")
+        out.append("")
     
     @classmethod
-    def _render_findings(cls, result: AnalysisResult) -> None:
+    def _render_findings(cls, out: List[str], result: AnalysisResult, colors: Dict[str, str]) -> None:
         """Render findings section"""
         if not result.findings:
-            green = cls.COLORS["GREEN"]
-            bold = cls.COLORS["BOLD"]
-            reset = cls.COLORS["RESET"]
-            print(f"{green}{bold}✓ No issues found - system is compliant{reset}\n")
+            green = colors["GREEN"]
+            bold = colors["BOLD"]
+            reset = colors["RESET"]
+            out.append(f"{green}{bold}✓ No issues found - system is compliant{reset}\n")
             return
         
-        bold = cls.COLORS["BOLD"]
-        reset = cls.COLORS["RESET"]
+        bold = colors["BOLD"]
+        reset = colors["RESET"]
+        gray = colors["GRAY"]
         
-        print(f"{bold}FINDINGS{reset}")
-        print("=" * 64)
+        out.append(f"{bold}FINDINGS{reset}")
+        out.append("=" * 64)
         
-        # Group by severity
-        by_severity = {}
+        # Group by severity (one pass, input order kept within a group)
+        by_severity = defaultdict(list)
         for finding in result.findings:
-            severity = finding.get("severity", "INFO")
-            if severity not in by_severity:
-                by_severity[severity] = []
-            by_severity[severity].append(finding)
+            by_severity[finding.get("severity", "INFO")].append(finding)
         
         # Render in severity order
-        severity_order = ["CRITICAL", "HIGH", "MEDIUM", "LOW", "INFO"]
-        
-        for severity in severity_order:
-            if severity not in by_severity:
+        for severity in cls.SEVERITY_ORDER:
+            findings = by_severity.get(severity)
+            if not findings:
                 continue
             
-            findings = by_severity[severity]
-            color = cls.COLORS[cls.SEVERITY_COLORS.get(severity, "GRAY")]
+            color = colors[cls.SEVERITY_COLORS.get(severity, "GRAY")]
             
-            print(f"\n{color}{bold}[{severity}]{reset} - {len(findings)} issue(s)")
-            print("-" * 64)
+            out.append(f"\n{color}{bold}[{severity}]{reset} - {len(findings)} issue(s)")
+            out.append("-" * 64)
             
             for i, finding in enumerate(findings, 1):
-                cls._render_finding(finding, i, color)
+                cls._render_finding(out, finding, i, color, gray, reset)
         
-        print()
+        out.append("")
     
     @classmethod
-    def _render_finding(cls, finding: Dict, index: int, color: str) -> None:
-        """Render individual finding"""
-        reset = cls.COLORS["RESET"]
-        gray = cls.COLORS["GRAY"]
-        
+    def _render_finding(cls, out: List[str], finding: Dict, index: int, color: str, gray: str, reset: str) -> None:
+        """Render individual finding (escape codes resolved once by the caller)"""
         rule_id = finding.get("id", "UNKNOWN")
         message = finding.get("message", "No message")
         category = finding.get("category", "GENERAL")
         
-        print(f"{color}  {index}. [{rule_id}]{reset} {message}")
-        print(f"     {gray}Category: {category}{reset}")
+        out.append(f"{color}  {index}. [{rule_id}]{reset} {message}")
+        out.append(f"     {gray}Category: {category}{reset}")
         
         # Show details if available
         details = finding.get("details")
         if details and isinstance(details, dict):
             for key, value in details.items():
                 if isinstance(value, list) and len(value) <= 5:
-                    print(f"     {gray}{key}: {', '.join(map(str, value))}{reset}")
+                    out.append(f"     {gray}{key}: {', '.join(map(str, value))}{reset}")
                 elif not isinstance(value, (list, dict)):
-                    print(f"     {gray}{key}: {value}{reset}")
+                    out.append(f"     {gray}{key}: {value}{reset}")
         
-        print()
+        out.append("")
     
     @classmethod
-    def _render_footer(cls, result: AnalysisResult) -> None:
+    def _render_footer(cls, out: List[str], result: AnalysisResult, colors: Dict[str, str]) -> None:
         """Render analysis footer with metadata"""
-        gray = cls.COLORS["GRAY"]
-        reset = cls.COLORS["RESET"]
+        gray = colors["GRAY"]
+        reset = colors["RESET"]
         
         metadata = result.metadata
         if metadata:
-            print(f"{gray}Analysis Metadata:{reset}")
-            print(f"{gray}  Rules Executed: {metadata.get('rules_executed', 0)}{reset}")
-            print(f"{gray}  Critical: {metadata.get('critical', 0)} | " +
-                  f"High: {metadata.get('high', 0)} | " +
-                  f"Medium: {metadata.get('medium', 0)} | " +
-                  f"Low: {metadata.get('low', 0)}{reset}")
-            print()
+            out.append(f"{gray}Analysis Metadata:{reset}")
+            out.append(f"{gray}  Rules Executed: {metadata.get('rules_executed', 0)}{reset}")
+            out.append(f"{gray}  Critical: {metadata.get('critical', 0)} | "
+                       f"High: {metadata.get('high', 0)} | "
+                       f"Medium: {metadata.get('medium', 0)} | "
+                       f"Low: {metadata.get('low', 0)}{reset}")
+            out.append("")
 
 
 class CompactRenderer:
@@ -183,5 +188,5 @@ class CompactRenderer:
     def render(result: AnalysisResult) -> None:
         """Render compact one-line summary"""
         status = "✓ PASS" if result.verdict == "PASSED" else "✗ FAIL"
-        print(f"{status} | {result.target} | Score: {result.score:.0f} | " +
+        print(f"{status} | {result.target} | Score: {result.score:.0f} | "
               f"Risk: {result.risk} | Findings: {len(result.findings)}")
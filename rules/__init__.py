@@ -1,53 +1,76 @@
 """
 Rule Registry
 All validation rules available in the system
+
+Rule classes and DEFAULT_RULES are loaded on first access, so reading
+the rule-set summary (RULE_COUNT, CATEGORY_COUNTS) stays cheap.
 """
-from .base_rule import BaseRule
-from .completeness import (
-    CompletenessRule,
-    DecisionCompletenessRule,
-    ConstraintCompletenessRule,
-    MetadataCompletenessRule
-)
-from .consistency import (
-    DecisionConsistencyRule,
-    ConstraintReferenceRule,
-    TypeConsistencyRule,
-    ValueRangeConsistencyRule
-)
-from .structure import (
-    DecisionStructureRule,
-    NestedDepthRule,
-    ConstraintStructureRule,
-    SystemNameRule,
-    EmptyValuesRule
-)
+from importlib import import_module
+
+from ._lite import RULE_COUNT, CATEGORY_COUNTS
+
+# Public name -> defining submodule
+_RULE_MODULES = {
+    'BaseRule': 'base_rule',
+    # Completeness
+    'CompletenessRule': 'completeness',
+    'DecisionCompletenessRule': 'completeness',
+    'ConstraintCompletenessRule': 'completeness',
+    'MetadataCompletenessRule': 'completeness',
+    # Consistency
+    'DecisionConsistencyRule': 'consistency',
+    'ConstraintReferenceRule': 'consistency',
+    'TypeConsistencyRule': 'consistency',
+    'ValueRangeConsistencyRule': 'consistency',
+    # Structure
+    'DecisionStructureRule': 'structure',
+    'NestedDepthRule': 'structure',
+    'ConstraintStructureRule': 'structure',
+    'SystemNameRule': 'structure',
+    'EmptyValuesRule': 'structure',
+}
 
 # Default rule set - enterprise standard
-DEFAULT_RULES = [
+_DEFAULT_RULE_NAMES = [
     # Completeness
-    CompletenessRule(),
-    DecisionCompletenessRule(),
-    ConstraintCompletenessRule(),
-    MetadataCompletenessRule(),
+    'CompletenessRule',
+    'DecisionCompletenessRule',
+    'ConstraintCompletenessRule',
+    'MetadataCompletenessRule',
     
     # Consistency
-    DecisionConsistencyRule(),
-    ConstraintReferenceRule(),
-    TypeConsistencyRule(),
-    ValueRangeConsistencyRule(),
+    'DecisionConsistencyRule',
+    'ConstraintReferenceRule',
+    'TypeConsistencyRule',
+    'ValueRangeConsistencyRule',
     
     # Structure
-    DecisionStructureRule(),
-    NestedDepthRule(),
-    ConstraintStructureRule(),
-    SystemNameRule(),
-    EmptyValuesRule()
+    'DecisionStructureRule',
+    'NestedDepthRule',
+    'ConstraintStructureRule',
+    'SystemNameRule',
+    'EmptyValuesRule'
 ]
 
+
+def __getattr__(name):
+    if name == 'DEFAULT_RULES':
+        value = [__getattr__(rule_name)() for rule_name in _DEFAULT_RULE_NAMES]
+    elif name in _RULE_MODULES:
+        value = getattr(import_module(f'.{_RULE_MODULES[name]}', __name__), name)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    # Cache so later lookups (and DEFAULT_RULES identity) bypass __getattr__
+    globals()[name] = value
+    return value
+
+
 __all__ = [
     'BaseRule',
     'DEFAULT_RULES',
+    'RULE_COUNT',
+    'CATEGORY_COUNTS',
     # Completeness
     'CompletenessRule',
     'DecisionCompletenessRule',
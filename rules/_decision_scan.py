@@ -0,0 +1,114 @@
+"""
+Decision Scan
+Single pass over the decision list shared by the decision-level rules
+"""
+from dataclasses import dataclass, field
+from typing import Any, List, Optional, Set
+
+# Default fields every decision must carry (DecisionStructureRule.REQUIRED_FIELDS)
+REQUIRED_FIELDS = ["id", "description"]
+
+
+@dataclass
+class DecisionScan:
+    """Everything the decision rules need from one pass over the decisions"""
+    duplicates: List[Any] = field(default_factory=list)
+    valid_ids: Set[Any] = field(default_factory=set)
+    type_errors: List[str] = field(default_factory=list)
+    range_violations: List[str] = field(default_factory=list)
+    structure_violations: List[str] = field(default_factory=list)
+    empty_values: List[str] = field(default_factory=list)
+    # Set when an unhashable id aborted the corresponding rule's own loop
+    duplicates_error: Optional[TypeError] = None
+    valid_ids_error: Optional[TypeError] = None
+
+
+def scan_decisions(decisions, required_fields=REQUIRED_FIELDS) -> DecisionScan:
+    """
+    Collect duplicate ids, valid ids, type errors, range violations,
+    missing required fields and empty descriptions in one pass
+    """
+    scan = DecisionScan()
+    ids_seen = set()
+    duplicates = scan.duplicates
+    valid_ids = scan.valid_ids
+    type_errors = scan.type_errors
+    range_violations = scan.range_violations
+    structure_violations = scan.structure_violations
+    empty_values = scan.empty_values
+    _isinst = isinstance
+    _dict = dict
+    _required = frozenset(required_fields)
+    _number = (int, float)
+    
+    for i, decision in enumerate(decisions):
+        if not _isinst(decision, _dict):
+            type_errors.append(f"Decision at index {i} is not a dict")
+            structure_violations.append(f"Decision at index {i} is not a dictionary")
+            continue
+        
+        # Key-view superset test runs in C; list the missing fields only on failure
+        if not decision.keys() >= _required:
+            missing = [f for f in required_fields if f not in decision]
+            label = decision.get("id", f"index_{i}")
+            structure_violations.append(f"Decision '{label}' missing: {', '.join(missing)}")
+        
+        decision_id = decision.get("id")
+        if decision_id and scan.duplicates_error is None:
+            try:
+                if decision_id in ids_seen:
+                    duplicates.append(decision_id)
+                ids_seen.add(decision_id)
+            except TypeError as e:
+                scan.duplicates_error = e
+        if "id" in decision and scan.valid_ids_error is None:
+            try:
+                valid_ids.add(decision["id"])
+            except TypeError as e:
+                scan.valid_ids_error = e
+        
+        # Priority must be numeric and within 0-100
+        if "priority" in decision:
+            priority = decision["priority"]
+            if not _isinst(priority, _number):
+                type_errors.append(
+                    f"Decision '{decision.get('id', i)}' has non-numeric priority"
+                )
+            elif priority < 0 or priority > 100:
+                range_violations.append(
+                    f"Decision '{decision.get('id', 'unknown')}' priority {priority} outside range [0-100]"
+                )
+        
+        # Confidence must be within 0-1
+        confidence = decision.get("confidence")
+        if _isinst(confidence, _number):
+            if confidence < 0 or confidence > 1:
+                range_violations.append(
+                    f"Decision '{decision.get('id', 'unknown')}' confidence {confidence} outside range [0-1]"
+                )
+        
+        # Description must not be blank
+        description = decision.get("description")
+        if _isinst(description, str) and not description.strip():
+            empty_values.append(f"Decision '{decision.get('id', 'unknown')}' has empty description")
+    
+    return scan
+
+
+def shared_scan(decisions, context, required_fields=REQUIRED_FIELDS) -> DecisionScan:
+    """
+    Return the scan of decisions, shared through the context's run cache
+    across the rules of one engine run. Engine.run clears that cache, so
+    a list mutated between runs is rescanned; within a run the entry is
+    also tied to the decisions object itself and to the required fields.
+    """
+    if context is None:
+        return scan_decisions(decisions, required_fields)
+    run_cache = context.run_cache
+    key = ("decision_scan", tuple(required_fields))
+    cached = run_cache.get(key)
+    if cached is not None and cached[0] is decisions:
+        return cached[1]
+    scan = scan_decisions(decisions, required_fields)
+    run_cache[key] = (decisions, scan)
+    return scan
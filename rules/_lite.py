@@ -0,0 +1,13 @@
+"""
+Rule-Set Metadata
+Static summary of DEFAULT_RULES, importable without loading any rule class.
+Keep in sync with the registry in rules/__init__.py (checked by the tests).
+"""
+
+RULE_COUNT = 13
+
+CATEGORY_COUNTS = {
+    "COMPLETENESS": 4,
+    "CONSISTENCY": 4,
+    "STRUCTURE": 5,
+}
@@ -11,6 +11,7 @@ class BaseRule(ABC):
     Abstract base class for all validation rules.
     Every rule MUST implement evaluate().
     """
+    __slots__ = ("_finding_template",)  # Subclasses declare __slots__ = ()
     
     # Rule metadata (override in subclasses)
     id: str = "BASE"
@@ -18,6 +19,19 @@ class BaseRule(ABC):
     description: str = "Base rule"
     category: str = "GENERAL"
     
+    def __init__(self):
+        self._finding_template = self._build_finding_template()
+    
+    def _build_finding_template(self) -> Dict:
+        """Constant part of every finding; "message" holds its key position"""
+        return {
+            "id": self.id,
+            "severity": self.severity,
+            "message": None,
+            "category": self.category,
+            "rule": self.__class__.__name__
+        }
+    
     @abstractmethod
     def evaluate(self, data: Dict[str, Any], context) -> Optional[Dict]:
         """
@@ -50,13 +64,13 @@ class BaseRule(ABC):
         Returns:
             Finding dictionary
         """
-        finding = {
-            "id": self.id,
-            "severity": self.severity,
-            "message": message,
-            "category": self.category,
-            "rule": self.__class__.__name__
-        }
+        try:
+            template = self._finding_template
+        except AttributeError:  # Subclass __init__ did not call super()
+            template = self._finding_template = self._build_finding_template()
+        
+        finding = template.copy()
+        finding["message"] = message
         
         if details:
             finding["details"] = details
@@ -8,6 +8,7 @@ from .base_rule import BaseRule
 
 class CompletenessRule(BaseRule):
     """Validates that all required keys are present"""
+    __slots__ = ()
     
     id = "AX-001"
     severity = "HIGH"
@@ -30,6 +31,7 @@ class CompletenessRule(BaseRule):
 
 class DecisionCompletenessRule(BaseRule):
     """Validates that decisions list is not empty"""
+    __slots__ = ()
     
     id = "AX-002"
     severity = "HIGH"
@@ -62,6 +64,7 @@ class DecisionCompletenessRule(BaseRule):
 
 class ConstraintCompletenessRule(BaseRule):
     """Validates that constraints are properly defined"""
+    __slots__ = ()
     
     id = "AX-003"
     severity = "MEDIUM"
@@ -88,6 +91,7 @@ class ConstraintCompletenessRule(BaseRule):
 
 class MetadataCompletenessRule(BaseRule):
     """Validates essential metadata presence"""
+    __slots__ = ()
     
     id = "AX-004"
     severity = "LOW"
@@ -4,10 +4,12 @@ Validates internal logical consistency of the system
 """
 from typing import Dict, Any, Optional, Set
 from .base_rule import BaseRule
+from ._decision_scan import shared_scan
 
 
 class DecisionConsistencyRule(BaseRule):
     """Validates that decision IDs are unique"""
+    __slots__ = ()
     
     id = "CX-001"
     severity = "CRITICAL"
@@ -20,18 +22,10 @@ class DecisionConsistencyRule(BaseRule):
         if not isinstance(decisions, list):
             return None  # Type checking is handled by completeness rules
         
-        ids_seen = set()
-        duplicates = []
-        
-        for i, decision in enumerate(decisions):
-            if not isinstance(decision, dict):
-                continue
-                
-            decision_id = decision.get("id")
-            if decision_id:
-                if decision_id in ids_seen:
-                    duplicates.append(decision_id)
-                ids_seen.add(decision_id)
+        scan = shared_scan(decisions, context)
+        if scan.duplicates_error is not None:
+            raise scan.duplicates_error
+        duplicates = scan.duplicates
         
         if duplicates:
             return self._create_finding(
@@ -47,6 +41,7 @@ class DecisionConsistencyRule(BaseRule):
 
 class ConstraintReferenceRule(BaseRule):
     """Validates that constraint references point to valid decisions"""
+    __slots__ = ()
     
     id = "CX-002"
     severity = "HIGH"
@@ -57,11 +52,13 @@ class ConstraintReferenceRule(BaseRule):
         decisions = data.get("decisions", [])
         constraints = data.get("constraints", {})
         
-        # Build set of valid decision IDs
-        valid_ids = set()
-        for decision in decisions:
-            if isinstance(decision, dict) and "id" in decision:
-                valid_ids.add(decision["id"])
+        if not isinstance(decisions, list) or not isinstance(constraints, dict):
+            return None  # Type checking is handled by completeness rules
+        
+        scan = shared_scan(decisions, context)
+        if scan.valid_ids_error is not None:
+            raise scan.valid_ids_error
+        valid_ids = scan.valid_ids
         
         # Check constraint references
         invalid_refs = []
@@ -87,6 +84,7 @@ class ConstraintReferenceRule(BaseRule):
 
 class TypeConsistencyRule(BaseRule):
     """Validates consistent types across the system"""
+    __slots__ = ()
     
     id = "CX-003"
     severity = "MEDIUM"
@@ -96,19 +94,10 @@ class TypeConsistencyRule(BaseRule):
     def evaluate(self, data: Dict[str, Any], context) -> Optional[Dict]:
         decisions = data.get("decisions", [])
         
-        type_errors = []
+        if not isinstance(decisions, list):
+            return None  # Type checking is handled by completeness rules
         
-        for i, decision in enumerate(decisions):
-            if not isinstance(decision, dict):
-                type_errors.append(f"Decision at index {i} is not a dict")
-                continue
-            
-            # Check that priority is a number if present
-            if "priority" in decision:
-                if not isinstance(decision["priority"], (int, float)):
-                    type_errors.append(
-                        f"Decision '{decision.get('id', i)}' has non-numeric priority"
-                    )
+        type_errors = shared_scan(decisions, context).type_errors
         
         if type_errors:
             return self._create_finding(
@@ -121,6 +110,7 @@ class TypeConsistencyRule(BaseRule):
 
 class ValueRangeConsistencyRule(BaseRule):
     """Validates that values are within expected ranges"""
+    __slots__ = ()
     
     id = "CX-004"
     severity = "LOW"
@@ -130,27 +120,10 @@ class ValueRangeConsistencyRule(BaseRule):
     def evaluate(self, data: Dict[str, Any], context) -> Optional[Dict]:
         decisions = data.get("decisions", [])
         
-        range_violations = []
-        
-        for decision in decisions:
-            if not isinstance(decision, dict):
-                continue
-            
-            # Check priority range (should be 0-100)
-            priority = decision.get("priority")
-            if priority is not None and isinstance(priority, (int, float)):
-                if priority < 0 or priority > 100:
-                    range_violations.append(
-                        f"Decision '{decision.get('id', 'unknown')}' priority {priority} outside range [0-100]"
-                    )
-            
-            # Check confidence range (should be 0-1)
-            confidence = decision.get("confidence")
-            if confidence is not None and isinstance(confidence, (int, float)):
-                if confidence < 0 or confidence > 1:
-                    range_violations.append(
-                        f"Decision '{decision.get('id', 'unknown')}' confidence {confidence} outside range [0-1]"
-                    )
+        if not isinstance(decisions, list):
+            return None  # Type checking is handled by completeness rules
+        
+        range_violations = shared_scan(decisions, context).range_violations
         
         if range_violations:
             return self._create_finding(
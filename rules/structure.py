@@ -4,34 +4,27 @@ Validates the structural integrity and format of the system
 """
 from typing import Dict, Any, Optional
 from .base_rule import BaseRule
+from ._decision_scan import REQUIRED_FIELDS, shared_scan
 
 
 class DecisionStructureRule(BaseRule):
     """Validates that each decision has required structure"""
+    __slots__ = ()
     
     id = "SX-001"
     severity = "HIGH"
     description = "Decision missing required fields"
     category = "STRUCTURE"
     
-    REQUIRED_FIELDS = ["id", "description"]
+    REQUIRED_FIELDS = REQUIRED_FIELDS
     
     def evaluate(self, data: Dict[str, Any], context) -> Optional[Dict]:
         decisions = data.get("decisions", [])
         
-        invalid_decisions = []
+        if not isinstance(decisions, list):
+            return None  # Type checking handled elsewhere
         
-        for i, decision in enumerate(decisions):
-            if not isinstance(decision, dict):
-                invalid_decisions.append(f"Decision at index {i} is not a dictionary")
-                continue
-            
-            missing = [f for f in self.REQUIRED_FIELDS if f not in decision]
-            if missing:
-                decision_id = decision.get("id", f"index_{i}")
-                invalid_decisions.append(
-                    f"Decision '{decision_id}' missing: {', '.join(missing)}"
-                )
+        invalid_decisions = shared_scan(decisions, context, self.REQUIRED_FIELDS).structure_violations
         
         if invalid_decisions:
             return self._create_finding(
@@ -44,6 +37,7 @@ class DecisionStructureRule(BaseRule):
 
 class NestedDepthRule(BaseRule):
     """Validates that nesting depth is reasonable"""
+    __slots__ = ()
     
     id = "SX-002"
     severity = "MEDIUM"
@@ -64,34 +58,43 @@ class NestedDepthRule(BaseRule):
         return None
     
     def _calculate_depth(self, obj, current_depth=1):
-        """Recursively calculate maximum nesting depth"""
+        """Calculate maximum nesting depth, walking containers with an explicit stack"""
         if not isinstance(obj, (dict, list)):
             return current_depth
         
-        if isinstance(obj, dict):
-            if not obj:
-                return current_depth
-            return max(
-                self._calculate_depth(v, current_depth + 1)
-                for v in obj.values()
-            )
-        else:  # list
-            if not obj:
-                return current_depth
-            return max(
-                self._calculate_depth(item, current_depth + 1)
-                for item in obj
-            )
+        max_depth = current_depth
+        stack = [(obj, current_depth)]
+        
+        while stack:
+            obj, depth = stack.pop()
+            children = obj.values() if isinstance(obj, dict) else obj
+            if not children:
+                continue
+            
+            # Every child, scalar or container, sits one level deeper
+            depth += 1
+            if depth > max_depth:
+                max_depth = depth
+            
+            for child in children:
+                if isinstance(child, (dict, list)) and child:
+                    stack.append((child, depth))
+        
+        return max_depth
 
 
 class ConstraintStructureRule(BaseRule):
     """Validates constraint structure"""
+    __slots__ = ()
     
     id = "SX-003"
     severity = "MEDIUM"
     description = "Malformed constraint structure"
     category = "STRUCTURE"
     
+    # A constraint needs at least one of these fields
+    REQUIRED_ANY = frozenset({"type", "applies_to"})
+    
     def evaluate(self, data: Dict[str, Any], context) -> Optional[Dict]:
         constraints = data.get("constraints", {})
         
@@ -99,11 +102,12 @@ class ConstraintStructureRule(BaseRule):
             return None  # Type checking handled elsewhere
         
         malformed = []
+        required_any = self.REQUIRED_ANY
         
         for name, constraint in constraints.items():
             if isinstance(constraint, dict):
-                # Check for common constraint fields
-                if "type" not in constraint and "applies_to" not in constraint:
+                # Key-view test probes the smaller side in C
+                if constraint.keys().isdisjoint(required_any):
                     malformed.append(
                         f"Constraint '{name}' has no 'type' or 'applies_to' field"
                     )
@@ -119,6 +123,7 @@ class ConstraintStructureRule(BaseRule):
 
 class SystemNameRule(BaseRule):
     """Validates system_name is properly formatted"""
+    __slots__ = ()
     
     id = "SX-004"
     severity = "LOW"
@@ -137,16 +142,17 @@ class SystemNameRule(BaseRule):
                 details={"actual_type": type(system_name).__name__}
             )
         
-        if len(system_name.strip()) == 0:
+        if system_name.isspace():
             return self._create_finding(
                 "System name is empty or whitespace only",
                 details={"value": system_name}
             )
         
-        if len(system_name) > 200:
+        length = len(system_name)
+        if length > 200:
             return self._create_finding(
-                f"System name is too long ({len(system_name)} characters, max 200)",
-                details={"length": len(system_name), "max": 200}
+                f"System name is too long ({length} characters, max 200)",
+                details={"length": length, "max": 200}
             )
         
         return None
@@ -154,6 +160,7 @@ class SystemNameRule(BaseRule):
 
 class EmptyValuesRule(BaseRule):
     """Detects empty or null critical values"""
+    __slots__ = ()
     
     id = "SX-005"
     severity = "LOW"
@@ -163,19 +170,10 @@ class EmptyValuesRule(BaseRule):
     def evaluate(self, data: Dict[str, Any], context) -> Optional[Dict]:
         decisions = data.get("decisions", [])
         
-        empty_values = []
+        if not isinstance(decisions, list):
+            return None  # Type checking handled elsewhere
         
-        for decision in decisions:
-            if not isinstance(decision, dict):
-                continue
-            
-            decision_id = decision.get("id", "unknown")
-            
-            # Check for empty description
-            description = decision.get("description")
-            if description is not None and isinstance(description, str):
-                if len(description.strip()) == 0:
-                    empty_values.append(f"Decision '{decision_id}' has empty description")
+        empty_values = shared_scan(decisions, context).empty_values
         
         if empty_values:
             return self._create_finding(
@@ -3,9 +3,32 @@ Data Loader Service
 Handles loading and parsing of system data files
 """
 import json
-from typing import Dict, Any
+import mmap
+from typing import Dict, Any, Iterable, List
 from pathlib import Path
 
+try:
+    import orjson  # Optional accelerator: C parser, much faster on large inputs
+except ImportError:
+    orjson = None
+
+
+def _loads(document):
+    """
+    Parse a JSON document, with orjson when installed.
+    Input orjson rejects but stdlib json accepts (NaN/Infinity, lone
+    surrogate escapes) is re-parsed with json.loads. Note that orjson
+    reads integers wider than 64 bits as floats, losing precision where
+    stdlib json keeps them exact.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(document)
+        except orjson.JSONDecodeError:
+            if isinstance(document, memoryview):
+                document = document.tobytes()
+    return json.loads(document)
+
 
 class DataLoader:
     """
@@ -13,6 +36,11 @@ class DataLoader:
     Supports JSON files and dictionaries.
     """
     
+    # Files are read in one buffered call; past the mmap threshold
+    # orjson parses straight from the mapped pages without a copy
+    READ_BUFFER_SIZE = 1 << 20
+    MMAP_THRESHOLD = 16 << 20
+    
     @staticmethod
     def load_from_file(filepath: str) -> Dict[str, Any]:
         """
@@ -36,10 +64,13 @@ class DataLoader:
         if not path.is_file():
             raise ValueError(f"Not a file: {filepath}")
         
-        with open(path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        
-        return data
+        with open(path, 'rb', buffering=DataLoader.READ_BUFFER_SIZE) as f:
+            if orjson is not None and path.stat().st_size >= DataLoader.MMAP_THRESHOLD:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    with memoryview(mapped) as view:
+                        return _loads(view)
+            
+            return _loads(f.read())
     
     @staticmethod
     def load_from_string(json_string: str) -> Dict[str, Any]:
@@ -47,7 +78,7 @@ class DataLoader:
         Load system data from a JSON string.
         
         Args:
-            json_string: JSON formatted string
+            json_string: JSON formatted string (bytes are accepted too)
             
         Returns:
             Parsed data dictionary
@@ -55,7 +86,23 @@ class DataLoader:
         Raises:
             json.JSONDecodeError: If string contains invalid JSON
         """
-        return json.loads(json_string)
+        return _loads(json_string)
+    
+    @staticmethod
+    def load_many(json_strings: Iterable[str]) -> List[Dict[str, Any]]:
+        """
+        Load a batch of JSON documents (e.g. NDJSON lines) with one parser.
+        
+        Args:
+            json_strings: JSON formatted strings or bytes
+            
+        Returns:
+            Parsed data, in input order
+            
+        Raises:
+            json.JSONDecodeError: If any document contains invalid JSON
+        """
+        return list(map(_loads, json_strings))
     
     @staticmethod
     def load_from_dict(data: Dict[str, Any]) -> Dict[str, Any]:
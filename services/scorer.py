@@ -2,6 +2,7 @@
 Scoring Service
 Advanced scoring and risk calculation utilities
 """
+from collections import Counter
 from typing import Dict, List
 
 
@@ -20,6 +21,11 @@ class Scorer:
         "INFO": 1
     }
     
+    # Risk levels from lowest to highest; a finding's rank is its index
+    _RISK_LEVELS = ("NONE", "LOW", "MEDIUM", "HIGH", "CRITICAL")
+    _RISK_RANK = {level: rank for rank, level in enumerate(_RISK_LEVELS) if rank}
+    _TOP_RISK_RANK = len(_RISK_LEVELS) - 1
+    
     @staticmethod
     def calculate_weighted_score(findings: List[Dict], base_score: float = 100.0) -> float:
         """
@@ -32,12 +38,8 @@ class Scorer:
         Returns:
             Final weighted score
         """
-        penalty = 0
-        
-        for finding in findings:
-            severity = finding.get("severity", "INFO")
-            weight = Scorer.SEVERITY_WEIGHTS.get(severity, 1)
-            penalty += weight
+        weight = Scorer.SEVERITY_WEIGHTS.get
+        penalty = sum(weight(finding.get("severity", "INFO"), 1) for finding in findings)
         
         return max(0.0, base_score - penalty)
     
@@ -52,21 +54,17 @@ class Scorer:
         Returns:
             Risk level: CRITICAL | HIGH | MEDIUM | LOW | NONE
         """
-        if not findings:
-            return "NONE"
+        rank_of = Scorer._RISK_RANK.get
+        highest = 0
         
-        severities = [f.get("severity", "INFO") for f in findings]
+        for finding in findings:
+            rank = rank_of(finding.get("severity", "INFO"), 0)
+            if rank > highest:
+                highest = rank
+                if highest == Scorer._TOP_RISK_RANK:
+                    break  # Nothing outranks CRITICAL
         
-        if "CRITICAL" in severities:
-            return "CRITICAL"
-        elif "HIGH" in severities:
-            return "HIGH"
-        elif "MEDIUM" in severities:
-            return "MEDIUM"
-        elif "LOW" in severities:
-            return "LOW"
-        else:
-            return "NONE"
+        return Scorer._RISK_LEVELS[highest]
     
     @staticmethod
     def calculate_confidence(findings: List[Dict], total_rules: int) -> float:
@@ -86,15 +84,15 @@ class Scorer:
         # Base confidence
         base_confidence = 1.0
         
-        # Reduce confidence based on severity distribution
-        critical_count = sum(1 for f in findings if f.get("severity") == "CRITICAL")
+        # Reduce confidence based on severity distribution (one pass over findings)
+        severities = {f.get("severity") for f in findings}
         
-        if critical_count > 0:
+        if "CRITICAL" in severities:
             # High confidence in failure
             return 1.0
         
         # Lower confidence if many different severity levels
-        unique_severities = len(set(f.get("severity") for f in findings))
+        unique_severities = len(severities)
         confidence_penalty = unique_severities * 0.05
         
         return max(0.5, base_confidence - confidence_penalty)
@@ -118,10 +116,9 @@ class Scorer:
             "INFO": 0
         }
         
-        for finding in findings:
-            severity = finding.get("severity", "INFO")
-            if severity in distribution:
-                distribution[severity] += 1
+        counts = Counter(finding.get("severity", "INFO") for finding in findings)
+        for severity in distribution:
+            distribution[severity] = counts[severity]
         
         return distribution
     
@@ -74,18 +74,27 @@ class Validator:
     
     @staticmethod
     def _calculate_depth(obj, current=0):
-        """Recursively calculate nesting depth"""
+        """Calculate nesting depth, walking containers with an explicit stack"""
         if not isinstance(obj, (dict, list)):
             return current
         
-        if isinstance(obj, dict):
-            if not obj:
-                return current
-            return max(Validator._calculate_depth(v, current + 1) for v in obj.values())
-        else:
-            if not obj:
-                return current
-            return max(Validator._calculate_depth(item, current + 1) for item in obj)
+        max_depth = current
+        stack = [(obj, current)]
+        while stack:
+            obj, depth = stack.pop()
+            children = obj.values() if isinstance(obj, dict) else obj
+            if not children:
+                continue
+            
+            # Every child, scalar or container, sits one level deeper
+            depth += 1
+            if depth > max_depth:
+                max_depth = depth
+            for child in children:
+                if isinstance(child, (dict, list)) and child:
+                    stack.append((child, depth))
+        
+        return max_depth
     
     @staticmethod
     def quick_validate(data: Dict[str, Any]) -> Tuple[bool, str]:
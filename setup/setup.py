@@ -34,6 +34,9 @@ setup(
         # No dependencies!
     ],
     extras_require={
+        "fast": [
+            "orjson>=3.6.0",
+        ],
         "dev": [
             "pytest>=7.0.0",
             "black>=22.0.0",
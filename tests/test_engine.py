@@ -1,6 +1,7 @@
 """
 Unit Tests for Singularity Delta Engine
 """
+import json
 import unittest
 import sys
 from pathlib import Path
@@ -34,6 +35,16 @@ class TestAnalysisResult(unittest.TestCase):
         self.assertEqual(len(result.findings), 1)
         self.assertEqual(result.findings[0]["id"], "TEST")
     
+    def test_severity_counts(self):
+        """Test severity tallies track added and directly appended findings"""
+        result = AnalysisResult()
+        result.add_finding({"severity": "HIGH"})
+        result.add_finding({"severity": "HIGH"})
+        self.assertEqual(result.severity_counts()["HIGH"], 2)
+        result.findings.append({"severity": "LOW"})
+        self.assertEqual(result.severity_counts()["LOW"], 1)
+        self.assertEqual(result.severity_counts()["CRITICAL"], 0)
+    
     def test_to_dict(self):
         """Test dictionary export"""
         result = AnalysisResult()
@@ -42,6 +53,24 @@ class TestAnalysisResult(unittest.TestCase):
         data = result.to_dict()
         self.assertIsInstance(data, dict)
         self.assertEqual(data["target"], "test-system")
+    
+    def test_to_json(self):
+        """Test JSON export round-trips through the stdlib parser"""
+        result = AnalysisResult()
+        result.target = "test-system"
+        result.add_finding({"id": "TEST", "severity": "HIGH"})
+        result.metadata = {"graph": {1: "one"}}
+        data = json.loads(result.to_json())
+        self.assertEqual(data["target"], "test-system")
+        self.assertEqual(data["findings"][0]["id"], "TEST")
+        self.assertEqual(data["metadata"], {"graph": {"1": "one"}})
+    
+    def test_to_json_wide_integer(self):
+        """Test integers wider than 64 bits serialize exactly"""
+        result = AnalysisResult()
+        result.add_finding({"id": "TEST", "details": {"count": 2 ** 70}})
+        data = json.loads(result.to_json())
+        self.assertEqual(data["findings"][0]["details"]["count"], 2 ** 70)
 
 
 class TestExecutionContext(unittest.TestCase):
@@ -66,6 +95,15 @@ class TestExecutionContext(unittest.TestCase):
         context.set("existing_key", "value")
         self.assertTrue(context.has("existing_key"))
         self.assertFalse(context.has("nonexistent_key"))
+    
+    def test_memo(self):
+        """Test memoized values are computed once"""
+        context = ExecutionContext()
+        calls = []
+        compute = lambda: calls.append(1) or None
+        self.assertIsNone(context.memo("key", compute))
+        self.assertIsNone(context.memo("key", compute))
+        self.assertEqual(len(calls), 1)
 
 
 class TestEngine(unittest.TestCase):
@@ -118,6 +156,34 @@ class TestEngine(unittest.TestCase):
         self.assertEqual(result.verdict, "FAILED")
         self.assertEqual(result.risk, "CRITICAL")
         self.assertLess(result.score, 100)
+    
+    def test_verbose_engine_only_pauses_when_paced(self):
+        """Test verbose output does not sleep unless pacing is enabled"""
+        import io
+        from contextlib import redirect_stdout
+        from unittest import mock
+        data = {"system_name": "test"}
+        with mock.patch("core.engine.time.sleep") as sleep, redirect_stdout(io.StringIO()):
+            Engine(rules=[CompletenessRule()], verbose=True).run(data, "test")
+            self.assertFalse(sleep.called)
+            Engine(rules=[CompletenessRule()], verbose=True, pace=True).run(data, "test")
+            self.assertTrue(sleep.called)
+    
+    def test_engine_uses_replaced_rule(self):
+        """Test a rule replaced in place is the one that runs"""
+        engine = Engine(rules=[DecisionConsistencyRule()])
+        engine.run({"system_name": "test"}, "test")
+        engine.rules[0] = CompletenessRule()
+        result = engine.run({"system_name": "test"}, "test")
+        
+        self.assertIn("AX-001", [f.get("id") for f in result.findings])
+    
+    def test_rule_without_evaluate_is_reported(self):
+        """Test a rule lacking evaluate yields an ENGINE-ERROR finding"""
+        engine = Engine(rules=[object()])
+        result = engine.run({"system_name": "test"}, "test")
+        
+        self.assertEqual([f["id"] for f in result.findings], ["ENGINE-ERROR"])
 
 
 class TestCompletenessRule(unittest.TestCase):
@@ -180,6 +246,33 @@ class TestConsistencyRule(unittest.TestCase):
         rule = DecisionConsistencyRule()
         result = rule.evaluate(data, ExecutionContext())
         self.assertIsNone(result)
+    
+    def test_shared_context_rescans_new_decisions(self):
+        """Test a reused context does not serve another document's scan"""
+        context = ExecutionContext()
+        rule = DecisionConsistencyRule()
+        duplicated = {"decisions": [{"id": "D1"}, {"id": "D1"}]}
+        unique = {"decisions": [{"id": "D1"}, {"id": "D2"}]}
+        self.assertIsNotNone(rule.evaluate(duplicated, context))
+        self.assertIsNone(rule.evaluate(unique, context))
+    
+    def test_engine_rescans_mutated_decisions(self):
+        """Test re-running one Engine sees decisions appended since the last run"""
+        engine = Engine(rules=[DecisionConsistencyRule()])
+        data = {"decisions": [{"id": "D1"}]}
+        self.assertEqual(engine.run(data, "test").findings, [])
+        data["decisions"].append({"id": "D1"})
+        rule_ids = [f.get("id") for f in engine.run(data, "test").findings]
+        self.assertIn("CX-001", rule_ids)
+    
+    def test_malformed_collections_skip_consistency_rules(self):
+        """Test consistency rules leave non-list decisions to completeness rules"""
+        from rules import DEFAULT_RULES
+        engine = Engine(rules=DEFAULT_RULES)
+        result = engine.run({"system_name": "test", "decisions": None, "constraints": 5}, "test")
+        rule_ids = {f.get("id") for f in result.findings}
+        self.assertNotIn("ENGINE-ERROR", rule_ids)
+        self.assertIn("AX-002", rule_ids)
 
 
 class TestStructureRule(unittest.TestCase):
@@ -207,6 +300,326 @@ class TestStructureRule(unittest.TestCase):
         result = rule.evaluate(data, ExecutionContext())
         self.assertIsNotNone(result)
         self.assertEqual(result["severity"], "HIGH")
+    
+    def test_decision_structure_honours_required_fields(self):
+        """Test a rule overriding REQUIRED_FIELDS is checked against them"""
+        class OwnerRequiredRule(DecisionStructureRule):
+            __slots__ = ()
+            REQUIRED_FIELDS = ["id", "owner"]
+        
+        context = ExecutionContext()
+        data = {"decisions": [{"id": "D1", "description": "Decision 1"}]}
+        self.assertIsNone(DecisionStructureRule().evaluate(data, context))
+        result = OwnerRequiredRule().evaluate(data, context)
+        self.assertEqual(result["details"]["violations"], ["Decision 'D1' missing: owner"])
+    
+    def test_nested_depth_beyond_recursion_limit(self):
+        """Test nesting depth is measured without recursing per level"""
+        from rules.structure import NestedDepthRule
+        nested = []
+        for _ in range(sys.getrecursionlimit() + 100):
+            nested = [nested]
+        result = NestedDepthRule().evaluate({"constraints": nested}, ExecutionContext())
+        self.assertEqual(result["details"]["max_depth"], sys.getrecursionlimit() + 102)
+
+
+class TestCLI(unittest.TestCase):
+    """Test CLI argument dispatch"""
+    
+    def test_fast_parse_analyze(self):
+        """Test fast path parses analyze flags"""
+        from cli.cli import CLI
+        args = CLI._fast_parse(["analyze", "system.json", "--format=json", "--strict"])
+        self.assertEqual(args.file, "system.json")
+        self.assertEqual(args.format, "json")
+        self.assertTrue(args.strict)
+        self.assertFalse(args.no_color)
+    
+    def test_fast_parse_falls_back(self):
+        """Test help and invalid input defer to argparse"""
+        from cli.cli import CLI
+        self.assertIsNone(CLI._fast_parse(["analyze", "-h"]))
+        self.assertIsNone(CLI._fast_parse(["analyze", "system.json", "--format", "xml"]))
+        self.assertIsNone(CLI._fast_parse(["unknown"]))
+    
+    def test_usage_errors_list_every_command(self):
+        """Test argparse errors show the full usage line"""
+        import io
+        from contextlib import redirect_stderr
+        from cli.cli import CLI
+        stderr = io.StringIO()
+        with redirect_stderr(stderr), self.assertRaises(SystemExit):
+            CLI().run(["validate", "system.json", "--strict"])
+        self.assertIn("{analyze,validate,version}", stderr.getvalue())
+
+
+class TestRuleRegistry(unittest.TestCase):
+    """Test rule registry metadata"""
+    
+    def test_static_metadata_matches_default_rules(self):
+        """Test RULE_COUNT/CATEGORY_COUNTS agree with DEFAULT_RULES"""
+        from collections import Counter
+        from rules import DEFAULT_RULES, RULE_COUNT, CATEGORY_COUNTS
+        self.assertEqual(RULE_COUNT, len(DEFAULT_RULES))
+        self.assertEqual(dict(CATEGORY_COUNTS),
+                         dict(Counter(r.category for r in DEFAULT_RULES)))
+
+
+class TestCounterfactualSimulator(unittest.TestCase):
+    """Test counterfactual simulation"""
+    
+    def test_scenarios_are_picklable(self):
+        """Test scenarios and violations survive a pickle round trip"""
+        import pickle
+        from core.reality_graph.graph_builder import RealityGraph, Node, NodeType
+        from core.axioms.axiom_base import AxiomRegistry
+        from core.counterfactuals.scenario_generator import CounterfactualSimulator
+    
+        graph = RealityGraph()
+        graph.add_node(Node(id="cpu", type=NodeType.RESOURCE, name="cpu pool",
+                            criticality=0.9, metadata={}))
+        simulator = CounterfactualSimulator(graph, AxiomRegistry())
+        simulator.generate_standard_scenarios()
+    
+        restored = pickle.loads(pickle.dumps(simulator.scenarios))
+        self.assertEqual([s.name for s in restored],
+                         [s.name for s in simulator.scenarios])
+    
+        results = simulator.run_simulation()
+        violations = [v for r in results for v in r.new_violations]
+        self.assertEqual(pickle.loads(pickle.dumps(violations)), violations)
+    
+    def test_axiom_cache_ignores_unread_context(self):
+        """Test cached axiom results are shared when read inputs match"""
+        from core.reality_graph.graph_builder import RealityGraph
+        from core.axioms.axiom_base import AxiomRegistry
+        registry = AxiomRegistry()
+        graph = RealityGraph()
+        cache = ExecutionContext()
+        first = registry.verify_all(graph, {"scenario": "a"}, cache=cache)
+        entries = len(cache.cache)
+        second = registry.verify_all(graph, {"scenario": "b"}, cache=cache)
+        self.assertEqual(first, second)
+        self.assertEqual(len(cache.cache), entries)
+    
+    def test_axiom_cache_not_slower_than_uncached(self):
+        """Test the cache key costs less than re-verifying a large graph"""
+        import time
+        from core.reality_graph.graph_builder import RealityGraph, Node, Edge
+        from core.axioms.axiom_base import AxiomRegistry
+        registry = AxiomRegistry()
+        graph = RealityGraph()
+        for i in range(2000):
+            graph.add_node(Node(id=f"n{i}", metadata={"load": i}))
+        for i in range(4000):
+            graph.add_edge(Edge(id=f"e{i}", source=f"n{i % 2000}", target=f"n{i * 7 % 2000}"))
+        
+        start = time.perf_counter()
+        for _ in range(8):
+            uncached = registry.verify_all(graph, {}, stop_on_fatal=False)
+        uncached_time = time.perf_counter() - start
+        cache = ExecutionContext()
+        start = time.perf_counter()
+        for _ in range(8):
+            cached = registry.verify_all(graph, {}, stop_on_fatal=False, cache=cache)
+        cached_time = time.perf_counter() - start
+        
+        self.assertEqual(cached, uncached)
+        self.assertLessEqual(cached_time, uncached_time)
+    
+    def test_axiom_cache_sees_graph_changes(self):
+        """Test a modified graph is re-verified rather than served stale"""
+        from core.reality_graph.graph_builder import RealityGraph, Node, NodeType
+        from core.axioms.axiom_base import AxiomRegistry
+        registry = AxiomRegistry()
+        graph = RealityGraph()
+        cache = ExecutionContext()
+        self.assertEqual(registry.verify_all(graph, {}, cache=cache), [])
+        graph.add_node(Node(id="b", type=NodeType.BEHAVIOR))
+        self.assertNotEqual(registry.verify_all(graph, {}, cache=cache), [])
+    
+    def test_scenarios_collect_every_violation(self):
+        """Test a scenario keeps violations after the first fatal one"""
+        from core.reality_graph.graph_builder import RealityGraph
+        from core.axioms.axiom_base import (AxiomBase, AxiomRegistry, AxiomViolation,
+                                            AxiomViolationType)
+        from core.counterfactuals.scenario_generator import (CounterfactualScenario,
+                                                             CounterfactualSimulator, ScenarioType)
+        
+        class FatalAxiom(AxiomBase):
+            def __init__(self, name):
+                super().__init__()
+                self.name = name
+            
+            def verify(self, reality_graph, context):
+                return AxiomViolation(self.name, AxiomViolationType.UNEXPLAINED_BEHAVIOR,
+                                      1.0, {}, (), "fatal")
+        
+        registry = AxiomRegistry()
+        registry.axioms = {name: FatalAxiom(name) for name in ("first", "second")}
+        simulator = CounterfactualSimulator(RealityGraph(), registry)
+        simulator.scenarios.append(CounterfactualScenario(
+            "noop", list(ScenarioType)[0], "", 0.5, [], {}))
+        result, = simulator.run_simulation()
+        self.assertEqual([v.axiom_name for v in result.new_violations], ["first", "second"])
+    
+    def test_journal_rollback_restores_graph(self):
+        """Test journaled scenario edits leave the base graph unchanged"""
+        from core.reality_graph.graph_builder import RealityGraph, Node, Edge, NodeType, EdgeType
+        from core.counterfactuals.scenario_generator import _GraphJournal
+        graph = RealityGraph()
+        for node_id in ("a", "b", "c"):
+            graph.add_node(Node(id=node_id, type=NodeType.DECISION, metadata={"load": 1}))
+        graph.add_edge(Edge(id="ab", source="a", target="b"))
+        graph.add_edge(Edge(id="bc", source="b", target="c"))
+        before = graph.fingerprint()
+        metadata = graph.nodes["a"].metadata
+        
+        version = graph.version
+        
+        journal = _GraphJournal(graph)
+        journal.set_metadata("a", "load", 3)
+        self.assertNotEqual(graph.version, version)
+        journal.set_metadata("a", "extra", True)
+        self.assertEqual(graph.nodes["a"].metadata, {"load": 3, "extra": True})
+        self.assertEqual(metadata, {"load": 1})
+        journal.add_edge(Edge(id="ca", source="c", target="a", type=EdgeType.CONTRADICTS))
+        journal.remove_node("b")
+        self.assertNotIn("b", graph.nodes)
+        self.assertEqual(list(graph.edges), ["ca"])
+        journal.rollback()
+        
+        self.assertEqual(graph.fingerprint(), before)
+        self.assertEqual(graph.version, version)
+        self.assertIs(graph.nodes["a"].metadata, metadata)
+        self.assertEqual(list(graph.nodes), ["a", "b", "c"])
+        self.assertEqual(list(graph.edges), ["ab", "bc"])
+
+
+class TestRealityGraph(unittest.TestCase):
+    """Test RealityGraph queries"""
+    
+    def test_causal_paths_limits(self):
+        """Test causal path enumeration, depth and count limits"""
+        from core.reality_graph.graph_builder import RealityGraph, Node, Edge, EdgeType
+        graph = RealityGraph()
+        for node_id in ("a", "b", "c", "d"):
+            graph.add_node(Node(id=node_id))
+        for source, target in [("a", "b"), ("b", "d"), ("a", "c"), ("c", "b"), ("a", "d")]:
+            graph.add_edge(Edge(source=source, target=target, type=EdgeType.CAUSES))
+        
+        paths = graph.compute_causal_paths("a", "d")
+        self.assertEqual(sorted(paths), [["a", "b", "d"], ["a", "c", "b", "d"], ["a", "d"]])
+        self.assertEqual(sorted(graph.compute_causal_paths("a", "d", max_depth=2)),
+                         [["a", "b", "d"], ["a", "d"]])
+        self.assertEqual(len(graph.compute_causal_paths("a", "d", max_paths=1)), 1)
+
+
+class TestFIICalculator(unittest.TestCase):
+    """Test Failure Inevitability Index analyses"""
+    
+    @staticmethod
+    def _chain_graph(node_ids, edges, edge_type=None):
+        from core.reality_graph.graph_builder import RealityGraph, Node, Edge, EdgeType
+        graph = RealityGraph()
+        for node_id in node_ids:
+            graph.add_node(Node(id=node_id, name=node_id))
+        for source, target in edges:
+            graph.add_edge(Edge(source=source, target=target,
+                                type=edge_type or EdgeType.REQUIRES))
+        return graph
+    
+    def test_deadlock_reports_every_cycle(self):
+        """Test each dependency cycle becomes its own deadlock path"""
+        from core.inevitability_index.fii_model import FIICalculator
+        graph = self._chain_graph(
+            ["a", "b", "c", "d", "e"],
+            [("a", "b"), ("b", "a"), ("c", "d"), ("d", "e"), ("e", "c")]
+        )
+        cycles = FIICalculator(graph, [])._find_deadlock_paths()
+        self.assertEqual(sorted(sorted(p.nodes) for p in cycles),
+                         [["a", "b"], ["c", "d", "e"]])
+    
+    def test_deadlock_handles_deep_chains(self):
+        """Test long dependency chains do not hit the recursion limit"""
+        from core.inevitability_index.fii_model import FIICalculator
+        node_ids = [f"n{i}" for i in range(5000)]
+        graph = self._chain_graph(node_ids, list(zip(node_ids, node_ids[1:])))
+        self.assertEqual(FIICalculator(graph, [])._find_deadlock_paths(), [])
+
+
+class TestHTMLReport(unittest.TestCase):
+    """Test HTML report rendering"""
+    
+    def test_escapes_finding_text(self):
+        """Test input-derived text cannot inject markup into the report"""
+        from output.html_report import HTMLReport
+        result = AnalysisResult()
+        result.verdict = "FAILED"
+        result.target = "<b>svc</b>"
+        result.add_finding({"id": "X&Y", "severity": "HIGH", "message": "<script>"})
+        html = HTMLReport._build_html(result)
+        self.assertNotIn("<script>", html)
+        self.assertNotIn("<B>SVC</B>", html)
+        self.assertIn("&lt;SCRIPT&gt;", html)
+        self.assertIn("X&amp;Y", html)
+
+
+class TestJSONExporter(unittest.TestCase):
+    """Test JSON export"""
+    
+    def test_source_hash_follows_file_changes(self):
+        """Test the cached source digest is recomputed when the file changes"""
+        import hashlib
+        import os
+        import tempfile
+        from output.json_exporter import JSONExporter
+        with tempfile.TemporaryDirectory() as tmp:
+            source = Path(tmp) / "system.json"
+            result = AnalysisResult()
+            result.source_path = str(source)
+            for content, mtime in ((b'{"a": 1}', 1_000_000_000), (b'{"a": 2}', 2_000_000_000)):
+                source.write_bytes(content)
+                os.utime(source, ns=(mtime, mtime))
+                data = json.loads(JSONExporter.export_to_string(result))
+                self.assertEqual(data["input"]["sha256"], hashlib.sha256(content).hexdigest())
+    
+    def test_findings_ndjson(self):
+        """Test NDJSON export writes a header line then one line per finding"""
+        import tempfile
+        from output.json_exporter import JSONExporter
+        result = AnalysisResult()
+        result.target = "test-system"
+        result.add_finding({"id": "A", "severity": "HIGH", "message": "line\nbreak"})
+        result.add_finding({"id": "B", "severity": "LOW"})
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "out" / "findings.ndjson"
+            JSONExporter.export_findings_ndjson(result, str(path))
+            lines = path.read_text(encoding="utf-8").splitlines()
+        self.assertEqual(len(lines), 3)
+        self.assertEqual(json.loads(lines[0])["target"], "test-system")
+        self.assertEqual([json.loads(line)["id"] for line in lines[1:]], ["A", "B"])
+
+
+class TestDataLoader(unittest.TestCase):
+    """Test DataLoader parsing"""
+    
+    def test_accepts_what_stdlib_json_accepts(self):
+        """Test NaN/Infinity and lone surrogates parse as with stdlib json"""
+        import math
+        from services.loader import DataLoader
+        document = '{"a": NaN, "b": Infinity, "c": "\\ud800"}'
+        data = DataLoader.load_from_string(document)
+        self.assertTrue(math.isnan(data["a"]))
+        self.assertEqual(data["b"], float("inf"))
+        self.assertEqual(data["c"], "\ud800")
+        self.assertEqual(len(DataLoader.load_many([document.encode("utf-8")])), 1)
+    
+    def test_invalid_json_raises_decode_error(self):
+        """Test malformed input still raises json.JSONDecodeError"""
+        from services.loader import DataLoader
+        with self.assertRaises(json.JSONDecodeError):
+            DataLoader.load_from_string("{bad")
 
 
 class TestIntegration(unittest.TestCase):